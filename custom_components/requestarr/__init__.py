@@ -6,15 +6,26 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
+from homeassistant.components import webhook
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_WEBHOOK_ID, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, FRONTEND_SCRIPT_URL
-from .coordinator import RequestarrCoordinator
-from .websocket import async_setup_websocket
+from .const import DOMAIN, FRONTEND_SCRIPT_URL, POSTER_CACHE_MAX_BYTES
+from .coordinator import (
+    RequestarrCoordinator,
+    RequestarrQueueCoordinator,
+    create_snapshot_store,
+)
+from .poster import PosterCache, PosterView, async_load_signing_key
+from .webhook import async_setup_webhook
+from .websocket import (
+    ServiceDefaults,
+    async_setup_websocket,
+    build_service_defaults,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +38,8 @@ class RequestarrData:
     """Data for the Requestarr integration."""
 
     coordinator: RequestarrCoordinator
+    queue_coordinator: RequestarrQueueCoordinator
+    service_defaults: dict[str, ServiceDefaults]
 
 
 type RequestarrConfigEntry = ConfigEntry[RequestarrData]
@@ -47,6 +60,7 @@ async def _async_register_lovelace_resource(lovelace) -> None:
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Requestarr integration."""
     frontend_path = Path(__file__).parent / "frontend"
+    await async_load_signing_key(hass)
     try:
         await hass.http.async_register_static_paths(
             [
@@ -57,8 +71,17 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 )
             ]
         )
+        hass.http.register_view(
+            PosterView(
+                PosterCache(
+                    hass,
+                    Path(hass.config.path(".cache", DOMAIN, "posters")),
+                    POSTER_CACHE_MAX_BYTES,
+                )
+            )
+        )
     except RuntimeError:
-        # Path already registered — happens on reload
+        # Paths already registered — happens on reload
         pass
 
     # Auto-register as Lovelace resource (storage mode only)
@@ -81,10 +104,28 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: RequestarrConfigEntry) -> bool:
     """Set up Requestarr from a config entry."""
+    if CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+
     coordinator = RequestarrCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # Runs on unload and when setup fails, so pools never leak
+    entry.async_on_unload(coordinator.async_close)
+    if await coordinator.async_restore_snapshot():
+        # Start from the saved snapshot and poll the arrs in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
-    entry.runtime_data = RequestarrData(coordinator=coordinator)
+    entry.runtime_data = RequestarrData(
+        coordinator=coordinator,
+        queue_coordinator=RequestarrQueueCoordinator(hass, entry, coordinator),
+        service_defaults=build_service_defaults(entry.data),
+    )
+    async_setup_webhook(hass, entry)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -92,4 +133,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: RequestarrConfigEntry) -
 
 async def async_unload_entry(hass: HomeAssistant, entry: RequestarrConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.queue_coordinator.async_shutdown()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: RequestarrConfigEntry) -> None:
+    """Delete the saved snapshot when an entry is removed."""
+    await create_snapshot_store(hass, entry.entry_id).async_remove()
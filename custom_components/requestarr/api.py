@@ -3,26 +3,157 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any
+import math
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
 
 import aiohttp
 
+from .cache import TTLCache
+from .resilience import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    CircuitBreaker,
+    PriorityLimiter,
+    RetryPolicy,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from .const import (
+    ALBUM_CACHE_SIZE,
+    ALBUM_CACHE_TTL,
     API_VERSIONS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
     DEFAULT_TIMEOUT,
     LIBRARY_ENDPOINTS,
+    LIBRARY_INDEX_KEYS,
     LOOKUP_ENDPOINTS,
+    MAX_CONCURRENT_REQUESTS,
+    POOL_CONNECTION_LIMIT,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    QUEUE_PAGE_CONCURRENCY,
     QUEUE_PAGE_SIZE,
+    RETRY_STATUSES,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+    SERVICE_RADARR,
+    SERVICE_SONARR,
+    STREAM_CHUNK_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Priority of arr requests issued from the current context
+_REQUEST_PRIORITY: ContextVar[int] = ContextVar(
+    "requestarr_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+# Bytes that change nesting depth or string state while scanning raw JSON
+_STRUCTURAL_RE = re.compile(rb'[\[\]{}"]')
+_STRING_SPECIAL_RE = re.compile(rb'[\\"]')
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPENERS = (ord("{"), ord("["))
+
+
+def create_arr_session() -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for one arr host.
+
+    Keeps arr traffic out of Home Assistant's shared pool so connections
+    to each arr stay warm between bursts of calls. The caller owns the
+    session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=POOL_CONNECTION_LIMIT,
+        limit_per_host=POOL_CONNECTION_LIMIT,
+        keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=POOL_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Queue arr requests made in this context behind interactive ones.
+
+    Used by the polling coordinators so library and queue refreshes never
+    delay searches and requests coming from the card.
+    """
+    token = _REQUEST_PRIORITY.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+def _json_loads(body: bytes) -> Any:
+    """Decode a JSON body, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _library_index_entry(
+    item: dict[str, Any], service_type: str
+) -> dict[str, Any]:
+    """Project a full library item down to the fields search enrichment needs.
+
+    Every entry carries the arr id, monitored flag and has_file. Sonarr
+    entries also keep per-season monitored state and file statistics in the
+    same shape /series/{id} returns them, so they can stand in for
+    async_get_series_seasons.
+    """
+    entry: dict[str, Any] = {
+        "id": item.get("id"),
+        "monitored": item.get("monitored", False),
+    }
+    stats = item.get("statistics") or {}
+    if service_type == SERVICE_RADARR:
+        entry["has_file"] = item.get("hasFile", False)
+    elif service_type == SERVICE_SONARR:
+        entry["has_file"] = stats.get("episodeFileCount", 0) > 0
+        entry["seasons"] = [
+            {
+                "seasonNumber": season.get("seasonNumber", 0),
+                "monitored": season.get("monitored", False),
+                "statistics": {
+                    key: (season.get("statistics") or {}).get(key, 0)
+                    for key in (
+                        "episodeFileCount",
+                        "episodeCount",
+                        "totalEpisodeCount",
+                    )
+                },
+            }
+            for season in item.get("seasons", [])
+        ]
+    else:
+        entry["has_file"] = stats.get("trackFileCount", 0) > 0
+    return entry
+
 
 class CannotConnectError(Exception):
     """Raised when a connection or timeout error occurs."""
 
 
+class CircuitOpenError(CannotConnectError):
+    """Raised without contacting the service while its circuit is open."""
+
+
 class InvalidAuthError(Exception):
     """Raised when the API returns a 401 or 403 response."""
 
@@ -30,6 +161,90 @@ class InvalidAuthError(Exception):
 class ServerError(Exception):
     """Raised when the server returns a non-auth HTTP error (4xx/5xx)."""
 
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize with the HTTP status, when known."""
+        super().__init__(message)
+        self.status = status
+
+
+class _JsonArrayScanner:
+    """Incrementally scan the elements of a top-level JSON array of objects.
+
+    Only nesting depth and string state are tracked, so the body can be fed
+    chunk by chunk straight off the socket without decoding it as a whole.
+    With capture=True the raw bytes of each completed element are collected
+    in `elements` (drain it after every feed) so callers can decode one
+    element at a time. Scalar elements at the top level are not counted —
+    arr library endpoints only ever return arrays of objects.
+    """
+
+    def __init__(self, capture: bool = False) -> None:
+        """Initialize the scanner."""
+        self.count = 0
+        self.elements: list[bytes] = []
+        self._capture = capture
+        self._partial = bytearray()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of the response body."""
+        pos = 0
+        end = len(chunk)
+        # Offset where the current element starts in this chunk, if any
+        start: int | None = 0 if self._depth >= 2 else None
+        if self._escape:
+            # Previous chunk ended on a backslash inside a string
+            pos = 1
+            self._escape = False
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL_RE.search(chunk, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if chunk[match.start()] == _BACKSLASH:
+                    pos += 1  # skip the escaped byte
+                    if pos > end:
+                        self._escape = True
+                else:
+                    self._in_string = False
+                continue
+            match = _STRUCTURAL_RE.search(chunk, pos)
+            if match is None:
+                break
+            pos = match.end()
+            char = chunk[match.start()]
+            if char == _QUOTE:
+                self._in_string = True
+            elif char in _OPENERS:
+                if self._depth == 1:
+                    self.count += 1
+                    start = match.start()
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 1 and start is not None:
+                    if self._capture:
+                        self._partial += chunk[start:pos]
+                        self.elements.append(bytes(self._partial))
+                        self._partial.clear()
+                    start = None
+        if self._capture and start is not None:
+            self._partial += chunk[start:]
+
+
+class _InFlight:
+    """A shared GET and the number of callers currently awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        """Initialize the in-flight record."""
+        self.task = task
+        self.waiters = 0
+
 
 class ArrClient:
     """Uniform API client for Radarr, Sonarr, and Lidarr.
@@ -50,6 +265,11 @@ class ArrClient:
         session: aiohttp.ClientSession,
         verify_ssl: bool = True,
         timeout: int = DEFAULT_TIMEOUT,
+        index_library: bool = False,
+        search_cache_ttl: float = SEARCH_CACHE_TTL,
+        search_cache_size: int = SEARCH_CACHE_SIZE,
+        retry_policy: RetryPolicy | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the arr API client.
 
@@ -57,9 +277,14 @@ class ArrClient:
             base_url: User-entered base URL (e.g., http://192.168.1.50:7878).
             api_key: API key for the arr service.
             service_type: One of 'radarr', 'sonarr', 'lidarr'.
-            session: Shared aiohttp session from HA.
+            session: aiohttp session (see create_arr_session).
             verify_ssl: Whether to verify SSL certificates.
             timeout: Request timeout in seconds.
+            index_library: Build library_index while counting the library.
+            search_cache_ttl: Seconds a lookup result is reused (0 disables).
+            search_cache_size: Maximum number of cached lookup queries.
+            retry_policy: Retry schedule for GETs (defaults to RetryPolicy()).
+            max_concurrency: Maximum requests in flight to this service.
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
@@ -68,6 +293,31 @@ class ArrClient:
         self._session = session
         self._ssl: bool | None = None if verify_ssl else False
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._index_library = index_library
+        # External ID (tmdbId/tvdbId/foreignArtistId) -> compact library entry
+        self.library_index: dict[Any, dict[str, Any]] = {}
+        self._breaker = CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+        )
+        self._retry_policy = retry_policy or RetryPolicy()
+        # Total GET retries performed, for diagnostics
+        self.retry_count = 0
+        self.limiter = PriorityLimiter(max_concurrency)
+        # (endpoint, params) -> shared in-flight GET
+        self._inflight: dict[tuple[str, tuple], _InFlight] = {}
+        # Normalized lookup term -> raw lookup results
+        self._search_cache: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            search_cache_size, search_cache_ttl
+        )
+        # (foreign artist ID, Lidarr artist ID or None) -> raw album list
+        self._album_cache: TTLCache[
+            tuple[str, int | None], list[dict[str, Any]]
+        ] = TTLCache(ALBUM_CACHE_SIZE, ALBUM_CACHE_TTL)
+
+    @property
+    def circuit_state(self) -> str:
+        """Return the circuit breaker state: closed, open or half_open."""
+        return self._breaker.state
 
     @property
     def _api_base(self) -> str:
@@ -78,24 +328,28 @@ class ArrClient:
         """Return authentication headers."""
         return {"X-Api-Key": self._api_key}
 
-    async def _request(
+    async def _send(
         self, method: str, endpoint: str, **kwargs: Any
-    ) -> Any:
-        """Make an authenticated request to the arr API.
+    ) -> aiohttp.ClientResponse:
+        """Send an authenticated request and check the response status.
 
-        Args:
-            method: HTTP method (GET, POST, etc.).
-            endpoint: API endpoint path (e.g., /system/status).
-            **kwargs: Additional arguments passed to aiohttp.
+        The body is left unread so callers can either parse it in one go
+        or stream it.
 
-        Returns:
-            Parsed JSON response, or empty dict if response body is empty.
+        After repeated connection failures the service's circuit opens and
+        requests fail immediately until the cool-down has passed.
 
         Raises:
+            CircuitOpenError: While the circuit is open (not sent at all).
             CannotConnectError: On connection/timeout errors.
             InvalidAuthError: On 401/403 responses.
             ServerError: On other 4xx/5xx responses.
         """
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(
+                f"{self._service_type} is unreachable; retrying in "
+                f"{self._breaker.retry_in:.0f}s"
+            )
         url = f"{self._api_base}{endpoint}"
         try:
             response = await self._session.request(
@@ -107,19 +361,30 @@ class ArrClient:
                 **kwargs,
             )
         except aiohttp.ClientConnectionError as err:
+            self._breaker.record_failure()
             raise CannotConnectError(
                 f"Connection error to {self._service_type}: {err}"
             ) from err
         except aiohttp.ClientError as err:
+            self._breaker.record_failure()
             raise CannotConnectError(
                 f"Client error for {self._service_type}: {err}"
             ) from err
         except asyncio.TimeoutError as err:
+            self._breaker.record_failure()
             raise CannotConnectError(
                 f"Request to {self._service_type} timed out"
             ) from err
+        except BaseException:
+            # Cancelled, or failed before reaching the service (e.g. a bad
+            # URL): no outcome, so a half-open probe must not stay pending
+            self._breaker.release()
+            raise
+        # Any HTTP response, even an error status, means the service is up
+        self._breaker.record_success()
 
         if response.status in (401, 403):
+            response.release()
             raise InvalidAuthError(
                 f"Authentication failed for {self._service_type} "
                 f"(HTTP {response.status})"
@@ -132,15 +397,188 @@ class ArrClient:
                 body = ""
             raise ServerError(
                 f"{self._service_type} returned HTTP {response.status}: "
-                f"{response.reason}. {body}"
+                f"{response.reason}. {body}",
+                status=response.status,
             )
 
+        return response
+
+    async def _request(
+        self, method: str, endpoint: str, *, coalesce: bool = True, **kwargs: Any
+    ) -> Any:
+        """Make an authenticated request to the arr API.
+
+        Identical GETs (same endpoint and params) that overlap in time share
+        a single HTTP request and every caller receives the same parsed
+        result. Callers that mutate the result must pass coalesce=False.
+        GETs are retried on transient failures per the client's RetryPolicy;
+        other methods are sent exactly once.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint path (e.g., /system/status).
+            coalesce: Share an identical in-flight GET instead of sending
+                a new one.
+            **kwargs: Additional arguments passed to aiohttp.
+
+        Returns:
+            Parsed JSON response, or empty dict if response body is empty.
+
+        Raises:
+            CannotConnectError: On connection/timeout errors.
+            InvalidAuthError: On 401/403 responses.
+            ServerError: On other 4xx/5xx responses.
+        """
+        if method != "GET":
+            return await self._request_once(method, endpoint, **kwargs)
+        if not coalesce or set(kwargs) - {"params"}:
+            return await self._with_retry(
+                lambda: self._request_once(method, endpoint, **kwargs)
+            )
+
+        params = kwargs.get("params") or {}
+        key = (endpoint, tuple(sorted((k, str(v)) for k, v in params.items())))
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InFlight(
+                asyncio.ensure_future(
+                    self._with_retry(
+                        lambda: self._request_once(method, endpoint, **kwargs)
+                    )
+                )
+            )
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(
+                lambda task: self._inflight_done(key, task)
+            )
+
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            # Only abandon the HTTP request once nobody is waiting for it
+            if inflight.waiters == 1 and not inflight.task.done():
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+
+    def _inflight_done(self, key: tuple[str, tuple], task: asyncio.Task) -> None:
+        """Forget a finished shared GET."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.task is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter went away
+
+    async def _with_retry(self, attempt: Callable[[], Awaitable[_T]]) -> _T:
+        """Run an idempotent request, retrying transient failures.
+
+        Connection errors and 502/503/504 responses are retried with
+        jittered exponential backoff until the policy's attempts or deadline
+        run out. An open circuit is never retried.
+        """
+        policy = self._retry_policy
+        started = time.monotonic()
+        retry = 0
+        while True:
+            try:
+                return await attempt()
+            except CircuitOpenError:
+                raise
+            except (CannotConnectError, ServerError) as err:
+                if isinstance(err, ServerError) and err.status not in RETRY_STATUSES:
+                    raise
+                delay = policy.delay(retry)
+                if (
+                    retry + 1 >= policy.attempts
+                    or time.monotonic() - started + delay > policy.deadline
+                ):
+                    raise
+                _LOGGER.debug(
+                    "Retrying %s request in %.2fs after: %s",
+                    self._service_type,
+                    delay,
+                    err,
+                )
+                retry += 1
+                self.retry_count += 1
+                await asyncio.sleep(delay)
+
+    async def _request_once(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> Any:
+        """Send one request and decode its JSON body.
+
+        Holds one of the service's concurrency slots until the body is read.
+        """
+        async with self.limiter.slot(_REQUEST_PRIORITY.get()):
+            response = await self._send(method, endpoint, **kwargs)
+            try:
+                body = await response.read()
+            except aiohttp.ClientError as err:
+                raise CannotConnectError(
+                    f"Connection error reading {self._service_type} "
+                    f"response: {err}"
+                ) from err
+            except asyncio.TimeoutError as err:
+                raise CannotConnectError(
+                    f"Request to {self._service_type} timed out"
+                ) from err
+
         # Handle empty response bodies (some endpoints return 200 with no body)
-        text = await response.text()
-        if not text or not text.strip():
+        if not body or not body.strip():
             return {}
 
-        return await response.json(content_type=None)
+        # Read once, decode once — straight from bytes, no intermediate str
+        return _json_loads(body)
+
+    async def _request_library(self, endpoint: str) -> int:
+        """GET a library endpoint and count its elements while streaming.
+
+        The body is consumed in STREAM_CHUNK_SIZE pieces and never decoded
+        as a whole, so memory stays flat regardless of the library size.
+        When library indexing is enabled, each element is decoded on its
+        own and projected into a fresh library_index, which replaces the
+        previous one only once the whole body has been read. A concurrency
+        slot is held for the whole stream.
+
+        Raises:
+            CannotConnectError: On connection/timeout errors, including a
+                connection dropped mid-body.
+            InvalidAuthError: On 401/403 responses.
+            ServerError: On other 4xx/5xx responses.
+        """
+        async with self.limiter.slot(_REQUEST_PRIORITY.get()):
+            response = await self._send("GET", endpoint)
+            scanner = _JsonArrayScanner(capture=self._index_library)
+            key_field = LIBRARY_INDEX_KEYS[self._service_type]
+            index: dict[Any, dict[str, Any]] = {}
+            try:
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    scanner.feed(chunk)
+                    for raw in scanner.elements:
+                        item = _json_loads(raw)
+                        key = item.get(key_field)
+                        if key:
+                            index[key] = _library_index_entry(
+                                item, self._service_type
+                            )
+                    scanner.elements.clear()
+            except aiohttp.ClientError as err:
+                raise CannotConnectError(
+                    f"Connection error reading {self._service_type} "
+                    f"response: {err}"
+                ) from err
+            except asyncio.TimeoutError as err:
+                raise CannotConnectError(
+                    f"Request to {self._service_type} timed out"
+                ) from err
+            finally:
+                response.release()
+        if self._index_library:
+            self.library_index = index
+        return scanner.count
 
     async def async_validate_connection(self) -> bool:
         """Validate the connection via /system/status.
@@ -185,14 +623,42 @@ class ArrClient:
     async def async_search(self, query: str) -> list[dict[str, Any]]:
         """Search the arr service's lookup endpoint.
 
+        Lookups proxy to TMDB/TVDB/MusicBrainz upstream, so results are
+        cached per normalized query (case and whitespace folded) for
+        search_cache_ttl seconds.
+
         Args:
             query: Search term.
 
         Returns:
             List of raw result dicts from the arr API.
         """
+        key = " ".join(query.casefold().split())
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
         endpoint = LOOKUP_ENDPOINTS[self._service_type]
-        return await self._request("GET", endpoint, params={"term": query})
+        results = await self._request("GET", endpoint, params={"term": query})
+        if isinstance(results, list):
+            self._search_cache.set(key, results)
+        return results
+
+    def invalidate_search(self, external_id: Any) -> None:
+        """Drop cached lookups that contain the given item.
+
+        Called after a successful request so the next search reflects the
+        new library state instead of the cached "not in library" result.
+
+        Args:
+            external_id: tmdbId (Radarr), tvdbId (Sonarr) or
+                foreignArtistId (Lidarr) of the requested item.
+        """
+        key_field = LIBRARY_INDEX_KEYS[self._service_type]
+        self._search_cache.discard_where(
+            lambda _, results: any(
+                item.get(key_field) == external_id for item in results
+            )
+        )
 
     async def async_request_movie(
         self,
@@ -320,37 +786,57 @@ class ArrClient:
 
     async def async_monitor_seasons(
         self, arr_id: int, season_numbers: list[int]
-    ) -> dict[str, Any]:
+    ) -> dict[int, bool]:
         """Monitor and search specific seasons for an existing Sonarr series.
 
         Fetches the current series data, sets the requested seasons to
-        monitored=True, saves via PUT, then triggers a SeasonSearch for each
-        newly monitored season.
+        monitored=True and saves via PUT. If every regular season is then
+        monitored, one SeriesSearch covers them all; otherwise a
+        SeasonSearch per requested season is submitted concurrently.
 
         Args:
             arr_id: Sonarr internal series ID.
             season_numbers: Season numbers to monitor and search.
 
         Returns:
-            Updated series dict from Sonarr.
+            Season number -> whether its search was queued. A failed search
+            command is non-critical, since the seasons are monitored.
         """
-        series = await self._request("GET", f"/series/{arr_id}")
-        for s in series.get("seasons", []):
+        series = await self._request("GET", f"/series/{arr_id}", coalesce=False)
+        seasons = series.get("seasons", [])
+        for s in seasons:
             if s.get("seasonNumber") in season_numbers:
                 s["monitored"] = True
         series["monitored"] = True
-        result = await self._request("PUT", f"/series/{arr_id}", json=series)
+        await self._request("PUT", f"/series/{arr_id}", json=series)
+        if not season_numbers:
+            return {}
 
-        for sn in season_numbers:
+        async def _search(command: dict[str, Any]) -> bool:
             try:
                 await self._request(
-                    "POST",
-                    "/command",
-                    json={"name": "SeasonSearch", "seriesId": arr_id, "seasonNumber": sn},
+                    "POST", "/command", json={**command, "seriesId": arr_id}
                 )
-            except ServerError:
-                pass  # search command failure is non-critical
-        return result
+            except ServerError as err:
+                _LOGGER.debug(
+                    "%s for series %s failed: %s", command["name"], arr_id, err
+                )
+                return False
+            return True
+
+        # Specials are left out of "every season": unmonitored episodes
+        # are never searched, so SeriesSearch still only covers the request
+        if all(s.get("monitored") for s in seasons if s.get("seasonNumber", 0) > 0):
+            searched = await _search({"name": "SeriesSearch"})
+            return dict.fromkeys(season_numbers, searched)
+
+        results = await asyncio.gather(
+            *(
+                _search({"name": "SeasonSearch", "seasonNumber": sn})
+                for sn in season_numbers
+            )
+        )
+        return dict(zip(season_numbers, results))
 
     async def async_get_movie(self, arr_id: int) -> dict[str, Any]:
         """Fetch a single movie from Radarr library by ID.
@@ -400,14 +886,9 @@ class ArrClient:
             List of album dicts with title, year, foreign_album_id, monitored, in_library.
         """
         from_library = bool(arr_id)
-        if from_library:
-            items = await self._request("GET", "/album", params={"artistId": arr_id})
-        else:
-            items = await self._request(
-                "GET", "/album/lookup", params={"term": f"lidarr:{foreign_artist_id}"}
-            )
+        items = await self._async_fetch_albums(foreign_artist_id, arr_id)
         result = []
-        for item in items if isinstance(items, list) else []:
+        for item in items:
             fid = item.get("foreignAlbumId") or item.get("foreignId")
             if not fid:
                 continue
@@ -437,6 +918,41 @@ class ArrClient:
             })
         return result
 
+    async def _async_fetch_albums(
+        self, foreign_artist_id: str, arr_id: int | None
+    ) -> list[dict[str, Any]]:
+        """Return the raw Lidarr album list for an artist, cached per artist.
+
+        Uses /album for library artists and /album/lookup (a MusicBrainz
+        proxy) otherwise; results are reused for ALBUM_CACHE_TTL seconds or
+        until invalidate_albums is called for the artist.
+        """
+        key = (foreign_artist_id, arr_id or None)
+        cached = self._album_cache.get(key)
+        if cached is not None:
+            return cached
+        if arr_id:
+            items = await self._request("GET", "/album", params={"artistId": arr_id})
+        else:
+            items = await self._request(
+                "GET", "/album/lookup", params={"term": f"lidarr:{foreign_artist_id}"}
+            )
+        if not isinstance(items, list):
+            return []
+        self._album_cache.set(key, items)
+        return items
+
+    def invalidate_albums(self, foreign_artist_id: str) -> None:
+        """Drop cached album lists for an artist.
+
+        Called after a successful artist or album request so the next
+        expand shows the new monitored and library state.
+
+        Args:
+            foreign_artist_id: MusicBrainz artist GUID.
+        """
+        self._album_cache.discard_where(lambda key, _: key[0] == foreign_artist_id)
+
     async def async_monitor_album(self, album_arr_id: int) -> dict[str, Any]:
         """Monitor and search an existing album in Lidarr.
 
@@ -446,7 +962,9 @@ class ArrClient:
         Returns:
             Updated album dict from Lidarr.
         """
-        album = await self._request("GET", f"/album/{album_arr_id}")
+        album = await self._request(
+            "GET", f"/album/{album_arr_id}", coalesce=False
+        )
         album["monitored"] = True
         result = await self._request("PUT", f"/album/{album_arr_id}", json=album)
         try:
@@ -469,9 +987,10 @@ class ArrClient:
     ) -> dict[str, Any]:
         """Add an artist to Lidarr with only the target album monitored.
 
-        Fetches the full album list via lookup, sets the target album to
-        monitored=True and all others to False, then POSTs the artist with
-        addOptions.monitor="none" so Lidarr respects the per-album flags.
+        Takes the full album list from the (cached) lookup, sets the target
+        album to monitored=True and all others to False, then POSTs the
+        artist with addOptions.monitor="none" so Lidarr respects the
+        per-album flags.
 
         Args:
             foreign_artist_id: MusicBrainz artist GUID.
@@ -489,15 +1008,13 @@ class ArrClient:
             InvalidAuthError: API key rejected.
             ServerError: Non-auth HTTP error. HTTP 400 means artist already exists.
         """
-        all_albums = await self._request(
-            "GET", "/album/lookup", params={"term": f"lidarr:{foreign_artist_id}"}
-        )
+        all_albums = await self._async_fetch_albums(foreign_artist_id, None)
         album_list = [
             {
                 "foreignAlbumId": a.get("foreignAlbumId") or a.get("foreignId"),
                 "monitored": (a.get("foreignAlbumId") or a.get("foreignId")) == foreign_album_id,
             }
-            for a in (all_albums if isinstance(all_albums, list) else [])
+            for a in all_albums
             if a.get("foreignAlbumId") or a.get("foreignId")
         ]
         payload = {
@@ -512,13 +1029,18 @@ class ArrClient:
         }
         return await self._request("POST", "/artist", json=payload)
 
-    async def async_get_queue(self) -> list[dict[str, Any]]:
-        """Fetch the download queue from the arr service.
+    async def async_iter_queue(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream the whole download queue from the arr service, page by page.
+
+        The first page reports totalRecords; the remaining pages are then
+        fetched concurrently (at most QUEUE_PAGE_CONCURRENCY at a time) and
+        yielded in page order. Records that shift onto a later page while
+        the queue is being read are yielded only once.
 
         Includes nested media objects (movie/series/artist) for readable titles.
 
-        Returns:
-            List of queue record dicts from the arr API.
+        Yields:
+            Lists of queue record dicts from the arr API.
         """
         # Each service needs its own include params for nested media objects
         include_params = {
@@ -526,12 +1048,59 @@ class ArrClient:
             "sonarr": {"includeSeries": "true", "includeEpisode": "true"},
             "lidarr": {"includeArtist": "true", "includeAlbum": "true"},
         }
-        params = {"pageSize": QUEUE_PAGE_SIZE}
+        params: dict[str, Any] = {"pageSize": QUEUE_PAGE_SIZE}
         params.update(include_params.get(self._service_type, {}))
-        data = await self._request("GET", "/queue", params=params)
-        if isinstance(data, dict):
-            return data.get("records", [])
-        return []
+
+        data = await self._request("GET", "/queue", params={**params, "page": 1})
+        if not isinstance(data, dict):
+            return
+        total = data.get("totalRecords") or len(data.get("records") or [])
+        pages = math.ceil(total / QUEUE_PAGE_SIZE)
+
+        semaphore = asyncio.Semaphore(QUEUE_PAGE_CONCURRENCY)
+
+        async def fetch_page(page: int) -> Any:
+            async with semaphore:
+                return await self._request(
+                    "GET", "/queue", params={**params, "page": page}
+                )
+
+        # Start the remaining pages before handing out the first one
+        tasks = [
+            asyncio.ensure_future(fetch_page(page)) for page in range(2, pages + 1)
+        ]
+        seen: set[Any] = set()
+
+        def unseen(page_data: Any) -> list[dict[str, Any]]:
+            if not isinstance(page_data, dict):
+                return []
+            page_records = [
+                r for r in page_data.get("records") or [] if r.get("id") not in seen
+            ]
+            seen.update(r.get("id") for r in page_records)
+            return page_records
+
+        try:
+            if page_records := unseen(data):
+                yield page_records
+            for task in tasks:
+                if page_records := unseen(await task):
+                    yield page_records
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def async_get_queue(self) -> list[dict[str, Any]]:
+        """Fetch the complete download queue from the arr service.
+
+        Returns:
+            List of queue record dicts from the arr API.
+        """
+        records: list[dict[str, Any]] = []
+        async for page in self.async_iter_queue():
+            records.extend(page)
+        return records
 
     async def async_delete_queue_item(
         self, queue_id: int, *, remove_from_client: bool = True, blocklist: bool = False
@@ -557,11 +1126,13 @@ class ArrClient:
         - Sonarr: /series (returns all series)
         - Lidarr: /artist (returns all artists)
 
+        The response is counted as it streams in rather than parsed, so
+        large libraries are never materialized as Python objects. If the
+        client was created with index_library=True, library_index is
+        rebuilt from the same pull.
+
         Returns:
             Total count of library items.
         """
         endpoint = LIBRARY_ENDPOINTS[self._service_type]
-        items = await self._request("GET", endpoint)
-        if isinstance(items, list):
-            return len(items)
-        return 0
+        return await self._with_retry(lambda: self._request_library(endpoint))
@@ -0,0 +1,72 @@
+"""In-memory caches for Requestarr."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+
+
+class TTLCache(Generic[_KT, _VT]):
+    """Bounded mapping whose entries expire a fixed time after being stored.
+
+    Reads refresh an entry's recency but not its expiry. When the cache is
+    full, the least recently used entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds an entry stays valid after it is stored.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[_KT, tuple[float, _VT]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._data)
+
+    def get(self, key: _KT) -> _VT | None:
+        """Return the cached value, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: _KT, value: _VT) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self._maxsize <= 0 or self._ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[_KT, _VT], bool]) -> int:
+        """Drop every entry for which predicate(key, value) is true.
+
+        Returns:
+            Number of entries dropped.
+        """
+        stale = [
+            key for key, (_, value) in self._data.items() if predicate(key, value)
+        ]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
@@ -14,14 +14,22 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
 )
 
-from .api import ArrClient, CannotConnectError, InvalidAuthError, ServerError
+from .api import (
+    ArrClient,
+    CannotConnectError,
+    InvalidAuthError,
+    ServerError,
+    create_arr_session,
+)
 from .const import (
     CONF_LIDARR_API_KEY,
     CONF_LIDARR_FOLDERS,
@@ -32,6 +40,8 @@ from .const import (
     CONF_LIDARR_ROOT_FOLDER,
     CONF_LIDARR_URL,
     CONF_LIDARR_VERIFY_SSL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_RADARR_API_KEY,
     CONF_RADARR_FOLDERS,
     CONF_RADARR_PROFILES,
@@ -46,7 +56,10 @@ from .const import (
     CONF_SONARR_ROOT_FOLDER,
     CONF_SONARR_URL,
     CONF_SONARR_VERIFY_SSL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DOMAIN,
+    SCAN_INTERVAL_FLOOR,
     SERVICE_LIDARR,
     SERVICE_RADARR,
     SERVICE_SONARR,
@@ -108,15 +121,23 @@ async def _validate_and_fetch(
         CannotConnectError: Cannot reach the service.
         InvalidAuthError: API key is invalid.
     """
-    session = async_get_clientsession(hass)
-    client = ArrClient(
-        base_url=url,
-        api_key=api_key,
-        service_type=service_type,
-        session=session,
-        verify_ssl=verify_ssl,
-    )
+    async with create_arr_session() as session:
+        return await _async_fetch_service_settings(
+            ArrClient(
+                base_url=url,
+                api_key=api_key,
+                service_type=service_type,
+                session=session,
+                verify_ssl=verify_ssl,
+            ),
+            service_type,
+        )
 
+
+async def _async_fetch_service_settings(
+    client: ArrClient, service_type: str
+) -> dict[str, Any]:
+    """Validate the connection and fetch profiles/folders with a ready client."""
     # Validate connection first
     await client.async_validate_connection()
 
@@ -427,7 +448,19 @@ class RequestarrOptionsFlowHandler(OptionsFlow):
                     _LOGGER.exception("Unexpected error refreshing profiles")
                     errors["base"] = "unknown"
 
+            min_interval = user_input.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+            )
+            max_interval = user_input.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            )
+            if not errors and min_interval > max_interval:
+                errors["base"] = "invalid_scan_interval"
+
             if not errors:
+                data[CONF_MIN_SCAN_INTERVAL] = int(min_interval)
+                data[CONF_MAX_SCAN_INTERVAL] = int(max_interval)
+
                 # Update selected profiles and folders
                 for key in (
                     CONF_RADARR_QUALITY_PROFILE_ID,
@@ -598,6 +631,29 @@ class RequestarrOptionsFlowHandler(OptionsFlow):
                 )
             ] = bool
 
+        # Adaptive polling bounds
+        interval_selector = NumberSelector(
+            NumberSelectorConfig(
+                min=SCAN_INTERVAL_FLOOR,
+                max=86400,
+                step=30,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        )
+        schema_dict[
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL,
+                default=data.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            )
+        ] = interval_selector
+        schema_dict[
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL,
+                default=data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            )
+        ] = interval_selector
+
         # Refresh profiles button
         schema_dict[vol.Optional(REFRESH_PROFILES, default=False)] = bool
 
@@ -6,6 +6,44 @@ DOMAIN = "requestarr"
 DEFAULT_TIMEOUT = 10  # 10-second connection timeout per arr API call
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes in seconds
 
+# Adaptive library polling: fastest while things change, doubling to the
+# slowest while they do not (both configurable in the options flow)
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 60  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 1800  # 30 minutes in seconds
+SCAN_INTERVAL_FLOOR = 30  # lowest bound the options flow accepts
+
+# Saved coordinator snapshot (counts + library index) for instant startup
+STORAGE_KEY = DOMAIN  # one file per entry: requestarr.<entry_id>
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # seconds; coalesces saves from bursts of updates
+
+# Poll interval once arr webhooks are arriving; polling is only a backstop
+WEBHOOK_SCAN_INTERVAL = 3600  # 1 hour in seconds
+WEBHOOK_PUSH_TIMEOUT = 86400  # seconds without events before normal polling resumes
+
+# Circuit breaker — fail fast while an arr service is unreachable
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive connection failures before opening
+CIRCUIT_RESET_TIMEOUT = 30  # seconds before a half-open probe is allowed
+
+# Concurrent in-flight requests per arr service
+MAX_CONCURRENT_REQUESTS = 4
+
+# Dedicated connection pool per arr base URL
+# Every request holds one of the client's limiter slots until its response
+# is released, so more connections than slots would never be used
+POOL_CONNECTION_LIMIT = MAX_CONCURRENT_REQUESTS
+POOL_KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+POOL_DNS_CACHE_TTL = 300  # seconds a resolved host address is reused
+
+# Retries for idempotent GETs (connection errors and 502/503/504)
+RETRY_ATTEMPTS = 3  # total attempts, including the first
+RETRY_BASE_DELAY = 0.5  # seconds, doubled per retry before jitter
+RETRY_MAX_DELAY = 4  # seconds
+RETRY_DEADLINE = 20  # seconds from the first attempt; no retry starts after
+RETRY_STATUSES = (502, 503, 504)
+
 # Arr service types
 SERVICE_RADARR = "radarr"
 SERVICE_SONARR = "sonarr"
@@ -26,6 +64,16 @@ LIBRARY_ENDPOINTS: dict[str, str] = {
     SERVICE_LIDARR: "/artist",
 }
 
+# External ID that keys each service's in-memory library index
+LIBRARY_INDEX_KEYS: dict[str, str] = {
+    SERVICE_RADARR: "tmdbId",
+    SERVICE_SONARR: "tvdbId",
+    SERVICE_LIDARR: "foreignArtistId",
+}
+
+# Read size when streaming large library responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # Config keys — Radarr
 CONF_RADARR_URL = "radarr_url"
 CONF_RADARR_API_KEY = "radarr_api_key"
@@ -66,6 +114,7 @@ LOOKUP_ENDPOINTS: dict[str, str] = {
 WS_TYPE_SEARCH_MOVIES = f"{DOMAIN}/search_movies"
 WS_TYPE_SEARCH_TV = f"{DOMAIN}/search_tv"
 WS_TYPE_SEARCH_MUSIC = f"{DOMAIN}/search_music"
+WS_TYPE_SEARCH_ALL = f"{DOMAIN}/search_all"
 
 # WebSocket command types — request
 WS_TYPE_REQUEST_MOVIE = f"{DOMAIN}/request_movie"
@@ -74,14 +123,54 @@ WS_TYPE_REQUEST_ARTIST = f"{DOMAIN}/request_artist"
 WS_TYPE_GET_SERIES_SEASONS = f"{DOMAIN}/get_series_seasons"
 WS_TYPE_GET_ARTIST_ALBUMS = f"{DOMAIN}/get_artist_albums"
 WS_TYPE_REQUEST_ALBUM = f"{DOMAIN}/request_album"
+WS_TYPE_REQUEST_BATCH = f"{DOMAIN}/request_batch"
 WS_TYPE_GET_QUEUE = f"{DOMAIN}/get_queue"
 WS_TYPE_DELETE_QUEUE_ITEM = f"{DOMAIN}/delete_queue_item"
+WS_TYPE_SUBSCRIBE_QUEUE = f"{DOMAIN}/subscribe_queue"
 
 # Search limits
 MAX_SEARCH_RESULTS = 20
+MAX_ENRICH_CONCURRENCY = 5  # concurrent /movie/{id} or /series/{id} calls per search
+
+# Request limits
+MAX_BATCH_REQUESTS = 50  # items accepted by one request_batch command
+
+# Lookup result cache (per service, keyed by normalized query)
+SEARCH_CACHE_TTL = 300  # seconds
+SEARCH_CACHE_SIZE = 128  # queries kept per service
+
+# Lidarr album list cache (keyed by foreign artist ID and library ID)
+ALBUM_CACHE_TTL = 600  # seconds
+ALBUM_CACHE_SIZE = 64  # artists kept
 
 # Queue
 QUEUE_PAGE_SIZE = 50
+QUEUE_PAGE_CONCURRENCY = 3  # pages fetched at once after the first
+QUEUE_SCAN_INTERVAL = 10  # seconds a shared queue snapshot stays fresh
+# Seconds a queue report keeps library polling fast; the queue is only
+# refreshed while a card watches it, so older reports are ignored
+QUEUE_ACTIVITY_TIMEOUT = QUEUE_SCAN_INTERVAL * 6
+
+# Arr Connect webhook payloads: media object and its external ID field
+WEBHOOK_MEDIA_KEYS = {
+    "radarr": ("movie", "tmdbId"),
+    "sonarr": ("series", "tvdbId"),
+    "lidarr": ("artist", "mbId"),
+}
+
+# Arr Connect webhook event types, grouped by how they change local state
+WEBHOOK_EVENTS_ADDED = ("MovieAdded", "SeriesAdd", "ArtistAdd", "ArtistAdded")
+WEBHOOK_EVENTS_DELETED = ("MovieDelete", "SeriesDelete", "ArtistDelete")
+WEBHOOK_EVENTS_FILE_DELETED = ("MovieFileDelete", "EpisodeFileDelete")
+WEBHOOK_EVENTS_QUEUE = ("Grab", "Download")
 
 # Frontend
 FRONTEND_SCRIPT_URL = f"/{DOMAIN}/{DOMAIN}-card.js"
+
+# Poster proxy: remote posters fetched once, downscaled and cached on disk
+POSTER_PROXY_URL = f"/{DOMAIN}/poster"
+POSTER_WIDTH = 300  # pixels; matches the TMDB w300 size used by the card
+POSTER_JPEG_QUALITY = 85
+POSTER_CACHE_MAX_BYTES = 50 * 1024 * 1024  # oldest-used files evicted past this
+POSTER_MAX_SOURCE_BYTES = 15 * 1024 * 1024  # larger originals are refused
+POSTER_FETCH_TIMEOUT = 15  # seconds
@@ -2,35 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.util import dt as dt_util
 
-from .api import ArrClient, CannotConnectError, InvalidAuthError
+from .api import (
+    ArrClient,
+    CannotConnectError,
+    InvalidAuthError,
+    ServerError,
+    background_requests,
+    create_arr_session,
+)
 from .const import (
     CONF_LIDARR_API_KEY,
     CONF_LIDARR_URL,
     CONF_LIDARR_VERIFY_SSL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_RADARR_API_KEY,
     CONF_RADARR_URL,
     CONF_RADARR_VERIFY_SSL,
     CONF_SONARR_API_KEY,
     CONF_SONARR_URL,
     CONF_SONARR_VERIFY_SSL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    QUEUE_ACTIVITY_TIMEOUT,
+    QUEUE_SCAN_INTERVAL,
     SERVICE_LIDARR,
     SERVICE_RADARR,
     SERVICE_SONARR,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    WEBHOOK_PUSH_TIMEOUT,
+    WEBHOOK_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,40 +77,141 @@ _SERVICE_CONFIG = {
 }
 
 
+def create_snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding an entry's last good coordinator snapshot."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+
+
+def _pack_library_index(
+    index: dict[Any, dict[str, Any]],
+) -> list[list[Any]]:
+    """Flatten a library index into positional rows for storage.
+
+    Rows are [external_id, id, monitored, has_file] plus, for Sonarr, a list
+    of [seasonNumber, monitored, episodeFileCount, episodeCount,
+    totalEpisodeCount] rows. Keeping external ids as values (not JSON object
+    keys) also preserves their int/str type across a save.
+    """
+    rows: list[list[Any]] = []
+    for external_id, entry in index.items():
+        row = [external_id, entry["id"], entry["monitored"], entry["has_file"]]
+        if "seasons" in entry:
+            row.append(
+                [
+                    [
+                        season["seasonNumber"],
+                        season["monitored"],
+                        season["statistics"]["episodeFileCount"],
+                        season["statistics"]["episodeCount"],
+                        season["statistics"]["totalEpisodeCount"],
+                    ]
+                    for season in entry["seasons"]
+                ]
+            )
+        rows.append(row)
+    return rows
+
+
+def _unpack_library_index(rows: list[list[Any]]) -> dict[Any, dict[str, Any]]:
+    """Rebuild a library index from rows written by _pack_library_index."""
+    index: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        entry: dict[str, Any] = {
+            "id": row[1],
+            "monitored": row[2],
+            "has_file": row[3],
+        }
+        if len(row) > 4:
+            entry["seasons"] = [
+                {
+                    "seasonNumber": number,
+                    "monitored": monitored,
+                    "statistics": {
+                        "episodeFileCount": files,
+                        "episodeCount": episodes,
+                        "totalEpisodeCount": total,
+                    },
+                }
+                for number, monitored, files, episodes, total in row[4]
+            ]
+        index[row[0]] = entry
+    return index
+
+
 class RequestarrCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage polling library counts from arr services.
 
-    Polls all configured arr services every 5 minutes. Handles partial
-    failure: if one service is down, others still update. Only raises
+    Polls all configured arr services concurrently every 5 minutes. Handles
+    partial failure: if one service is down, others still update. Only raises
     UpdateFailed if ALL configured services fail.
+
+    The last good counts and library index are saved to disk so setup can
+    start from them while the first poll runs in the background.
+
+    The poll interval adapts within the configured bounds: it drops to the
+    minimum while downloads are queued or counts are changing, and doubles
+    towards the maximum while nothing changes. Services that have recently
+    pushed library events through the webhook are only polled hourly, as
+    a consistency backstop.
     """
 
     config_entry: ConfigEntry
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        self._min_interval = entry.data.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+        self._max_interval = entry.data.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        # Service type -> when it last pushed a library event (UTC)
+        self._push_seen: dict[str, datetime] = {}
+        # Service type -> monotonic time of its last successful poll
+        self._polled_at: dict[str, float] = {}
+        # Services with downloads in their queue
+        self._queue_active: set[str] = set()
+        # Monotonic time of the last queue report
+        self._queue_seen = 0.0
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(
+                seconds=min(
+                    max(DEFAULT_SCAN_INTERVAL, self._min_interval),
+                    self._max_interval,
+                )
+            ),
         )
         self.config_entry = entry
-        session = async_get_clientsession(hass)
+        self._store = create_snapshot_store(hass, entry.entry_id)
+        # One dedicated connection pool per arr base URL, closed on unload
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
 
         # Build ArrClient instances for each configured service
         self._clients: dict[str, ArrClient] = {}
         for service_type, keys in _SERVICE_CONFIG.items():
             url = entry.data.get(keys["url"])
             if url:
+                base_url = url.rstrip("/")
+                if base_url not in self._sessions:
+                    self._sessions[base_url] = create_arr_session()
                 self._clients[service_type] = ArrClient(
                     base_url=url,
                     api_key=entry.data[keys["api_key"]],
                     service_type=service_type,
-                    session=session,
+                    session=self._sessions[base_url],
                     verify_ssl=entry.data.get(keys["verify_ssl"], True),
+                    index_library=True,
                 )
 
+    async def async_close(self) -> None:
+        """Close the per-host connection pools."""
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
     @property
     def configured_services(self) -> list[str]:
         """Return list of configured service types."""
@@ -98,11 +221,187 @@ class RequestarrCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the ArrClient for a service type, or None if not configured."""
         return self._clients.get(service_type)
 
+    def get_library_entry(
+        self, service_type: str, external_id: Any
+    ) -> dict[str, Any] | None:
+        """Return the indexed library entry for an item, or None if unknown.
+
+        The index is rebuilt from the same library pull that produces the
+        counts, keyed by tmdbId (Radarr), tvdbId (Sonarr) or foreignArtistId
+        (Lidarr).
+        """
+        client = self._clients.get(service_type)
+        if client is None or external_id is None:
+            return None
+        return client.library_index.get(external_id)
+
+    def _client_stats(self, service_type: str, client: ArrClient) -> dict[str, Any]:
+        """Return the live resilience stats reported for one service."""
+        return {
+            f"{service_type}_circuit": client.circuit_state,
+            f"{service_type}_retries": client.retry_count,
+            f"{service_type}_avg_wait": round(client.limiter.avg_wait, 3),
+        }
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved snapshot as provisional data.
+
+        Restores per-service counts, last sync times and library indexes for
+        the services still configured. The data is flagged "restored" and
+        carries no connection state or client stats, since no arr has been
+        contacted yet; the first real refresh replaces it. Returns False if
+        there is nothing usable on disk, in which case the caller should do
+        a blocking first refresh instead.
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        saved_data = stored.get("data", {})
+        saved_index = stored.get("index", {})
+        data: dict[str, Any] = {}
+        for service_type, client in self._clients.items():
+            if f"{service_type}_count" not in saved_data:
+                continue
+            data[f"{service_type}_count"] = saved_data[f"{service_type}_count"]
+            data[f"{service_type}_last_sync"] = saved_data.get(
+                f"{service_type}_last_sync"
+            )
+            client.library_index = _unpack_library_index(
+                saved_index.get(service_type, [])
+            )
+        if not data:
+            return False
+
+        for service_type, seen in stored.get("push", {}).items():
+            if service_type in self._clients and (
+                parsed := dt_util.parse_datetime(seen)
+            ):
+                self._push_seen[service_type] = parsed
+
+        data["errors"] = {}
+        data["restored"] = True
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the compact form of the current data saved to disk."""
+        return {
+            "data": {
+                key: value
+                for key, value in (self.data or {}).items()
+                if key.endswith(("_count", "_last_sync"))
+            },
+            "index": {
+                service_type: _pack_library_index(client.library_index)
+                for service_type, client in self._clients.items()
+            },
+            "push": {
+                service_type: seen.isoformat()
+                for service_type, seen in self._push_seen.items()
+            },
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the current snapshot once updates settle."""
+        self._store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_apply_library_change(
+        self, service_type: str, count_delta: int = 0
+    ) -> None:
+        """Publish a library change pushed by an arr webhook.
+
+        The caller has already updated the client's library index. The count
+        is adjusted in place, without moving the next scheduled poll, and
+        the snapshot is saved.
+        """
+        key = f"{service_type}_count"
+        if count_delta and self.data and self.data.get(key) is not None:
+            self.data = {**self.data, key: max(0, self.data[key] + count_delta)}
+            self.async_update_listeners()
+        self.async_schedule_save()
+
+    @callback
+    def async_use_push_updates(self, service_type: str) -> None:
+        """Record a library event pushed by a service's webhook.
+
+        The service's library is then polled only as an hourly backstop
+        until it has gone WEBHOOK_PUSH_TIMEOUT without pushing anything.
+        """
+        self._push_seen[service_type] = dt_util.utcnow()
+        if not self._polling_services():
+            self.update_interval = self._next_interval(changed=False)
+        self.async_schedule_save()
+
+    def _push_services(self) -> set[str]:
+        """Return the services whose webhook has pushed events recently."""
+        cutoff = dt_util.utcnow() - timedelta(seconds=WEBHOOK_PUSH_TIMEOUT)
+        return {
+            service_type
+            for service_type, seen in self._push_seen.items()
+            if seen > cutoff
+        }
+
+    def _polling_services(self) -> list[str]:
+        """Return the services that rely on polling for library changes."""
+        pushing = self._push_services()
+        return [s for s in self._clients if s not in pushing]
+
+    @callback
+    def async_set_queue_active(self, services: set[str]) -> None:
+        """Record which services have anything downloading.
+
+        When the queue of a polled service fills while polling has backed
+        off, poll now and return to the minimum interval.
+        """
+        was_busy = bool(self._busy_services())
+        self._queue_active = services
+        self._queue_seen = time.monotonic()
+        if was_busy or not self._busy_services():
+            return
+        if self.update_interval > timedelta(seconds=self._min_interval):
+            self.update_interval = timedelta(seconds=self._min_interval)
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN} queue started"
+            )
+
+    def _busy_services(self) -> set[str]:
+        """Return the polled services with downloads queued.
+
+        Queue reports older than QUEUE_ACTIVITY_TIMEOUT are ignored, so
+        polling backs off once nothing is watching the queue any more.
+        """
+        if time.monotonic() - self._queue_seen >= QUEUE_ACTIVITY_TIMEOUT:
+            return set()
+        return self._queue_active.intersection(self._polling_services())
+
+    def _next_interval(self, changed: bool) -> timedelta:
+        """Return the poll interval to use after a refresh.
+
+        Only services that rely on polling are considered: changed covers
+        their counts, and only their queues keep the interval short.
+        """
+        if not self._polling_services():
+            seconds = max(WEBHOOK_SCAN_INTERVAL, self._max_interval)
+        elif changed or self._busy_services():
+            seconds = self._min_interval
+        else:
+            seconds = min(
+                self.update_interval.total_seconds() * 2, self._max_interval
+            )
+        return timedelta(seconds=seconds)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch library counts from all configured arr services.
 
         Returns a dict with:
         - {service_type}_count: int | None for each configured service
+        - {service_type}_circuit: circuit breaker state for each service
+        - {service_type}_retries: total GET retries for each service
+        - {service_type}_avg_wait: mean seconds requests waited for a slot
         - errors: dict of service_type -> error message for failed services
 
         Raises UpdateFailed only if ALL services fail.
@@ -110,22 +409,57 @@ class RequestarrCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data: dict[str, Any] = {}
         errors: dict[str, str] = {}
 
+        # Services pushing webhook events keep their last counts until
+        # their hourly backstop poll is due
+        now = time.monotonic()
+        pushing = self._push_services()
+        due = {
+            service_type: client
+            for service_type, client in self._clients.items()
+            if service_type not in pushing
+            or service_type not in self._polled_at
+            or now - self._polled_at[service_type] >= WEBHOOK_SCAN_INTERVAL
+        }
+
+        # A successful poll replaces a client's index with a new dict
+        previous_index = {
+            service_type: client.library_index for service_type, client in due.items()
+        }
+
+        # Poll every service at once so refresh time is bounded by the
+        # slowest service rather than the sum of all of them. Polls queue
+        # behind interactive card traffic for a client's request slots.
+        with background_requests():
+            results = await asyncio.gather(
+                *(client.async_get_library_count() for client in due.values()),
+                return_exceptions=True,
+            )
+        polled = dict(zip(due, results))
+
         for service_type, client in self._clients.items():
-            try:
-                count = await client.async_get_library_count()
-                data[f"{service_type}_count"] = count
-                data[f"{service_type}_last_sync"] = dt_util.utcnow().isoformat()
-            except (CannotConnectError, InvalidAuthError) as err:
+            data.update(self._client_stats(service_type, client))
+            if service_type not in polled:
+                for key in (f"{service_type}_count", f"{service_type}_last_sync"):
+                    data[key] = (self.data or {}).get(key)
+                continue
+            result = polled[service_type]
+            if isinstance(result, (CannotConnectError, InvalidAuthError)):
                 _LOGGER.warning(
-                    "Failed to poll %s: %s", service_type, err
+                    "Failed to poll %s: %s", service_type, result
                 )
-                errors[service_type] = str(err)
+                errors[service_type] = str(result)
                 data[f"{service_type}_count"] = None
                 # Preserve previous last_sync value on error
                 if self.data:
                     data[f"{service_type}_last_sync"] = self.data.get(
                         f"{service_type}_last_sync"
                     )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                data[f"{service_type}_count"] = result
+                data[f"{service_type}_last_sync"] = dt_util.utcnow().isoformat()
+                self._polled_at[service_type] = now
 
         # If all configured services failed, raise UpdateFailed
         count_keys = [k for k in data if k.endswith("_count")]
@@ -135,4 +469,233 @@ class RequestarrCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
         data["errors"] = errors
+        changed = self.data is not None and any(
+            data[f"{service_type}_count"] != self.data.get(f"{service_type}_count")
+            for service_type in polled
+            if service_type not in pushing
+        )
+        self.update_interval = self._next_interval(changed)
+        # Save only when the snapshot contents moved. It is taken when the
+        # delayed save fires, after this result has become self.data
+        if (
+            self.data is None
+            or any(
+                data[f"{service_type}_count"]
+                != self.data.get(f"{service_type}_count")
+                for service_type in polled
+            )
+            or any(
+                client.library_index != previous_index[service_type]
+                for service_type, client in due.items()
+            )
+        ):
+            self.async_schedule_save()
         return data
+
+
+# ---------------------------------------------------------------------------
+# Download queue
+# ---------------------------------------------------------------------------
+
+
+def _format_timeleft(raw: str) -> str:
+    """Format .NET TimeSpan (e.g. '6.10:46:09.123' or '01:23:45') into human-friendly ETA."""
+    if not raw:
+        return ""
+    # Parse optional days prefix: "D.HH:MM:SS.fff" or "HH:MM:SS.fff"
+    days = 0
+    time_part = raw
+    if "." in raw.split(":")[0]:
+        day_str, time_part = raw.split(".", 1)
+        try:
+            days = int(day_str)
+        except ValueError:
+            return raw
+    # Strip fractional seconds
+    base = time_part.split(".")[0] if "." in time_part else time_part
+    parts = base.split(":")
+    if len(parts) != 3:
+        return raw
+    try:
+        h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return raw
+    h += days * 24
+    if h > 0:
+        return f"{h}h {m}m"
+    if m > 0:
+        return f"{m}m {s}s"
+    return f"{s}s"
+
+
+def _normalize_queue_item(item: dict[str, Any], service_type: str) -> dict[str, Any]:
+    """Normalize a queue record from any arr service into a standard format."""
+    size = item.get("size", 0)
+    sizeleft = item.get("sizeleft", 0)
+    progress = round((1 - sizeleft / size) * 100, 1) if size > 0 else 0.0
+
+    season_number = None
+    album_id = None
+
+    # Extract media_id and human-readable title from nested objects.
+    # The top-level "title" is the release/torrent name, not the media title.
+    if service_type == SERVICE_RADARR:
+        movie = item.get("movie") or {}
+        media_id = movie.get("id") or item.get("movieId")
+        title = movie.get("title", "") or item.get("title", "")
+    elif service_type == SERVICE_SONARR:
+        series = item.get("series") or {}
+        episode = item.get("episode") or {}
+        media_id = item.get("seriesId") or series.get("id")
+        series_title = series.get("title", "")
+        sn = item.get("seasonNumber") or episode.get("seasonNumber")
+        season_number = sn
+        ep = episode.get("episodeNumber")
+        ep_title = episode.get("title", "")
+        # Build "Bluey — S03E12 — Cricket"
+        parts = [series_title]
+        if sn is not None and ep is not None:
+            parts.append(f"S{sn:02d}E{ep:02d}")
+        elif sn is not None:
+            parts.append(f"S{sn:02d}")
+        if ep_title:
+            parts.append(ep_title)
+        title = " \u2014 ".join(parts) if parts[0] else item.get("title", "")
+    else:
+        artist = item.get("artist") or {}
+        album = item.get("album") or {}
+        media_id = item.get("artistId") or artist.get("id")
+        album_id = album.get("id")
+        artist_name = artist.get("artistName", "")
+        album_title = album.get("title", "")
+        if artist_name and album_title:
+            title = f"{artist_name} \u2014 {album_title}"
+        else:
+            title = artist_name or album_title or item.get("title", "")
+
+    return {
+        "title": title,
+        "service": service_type,
+        "media_id": media_id,
+        "season_number": season_number,
+        "album_id": album_id,
+        "progress": progress,
+        "timeleft": _format_timeleft(item.get("timeleft") or ""),
+        "status": item.get("status", ""),
+        "queue_id": item.get("id"),
+    }
+
+
+class RequestarrQueueCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator owning one shared, normalized download-queue snapshot.
+
+    Every get_queue call is served from this snapshot, so arr queue traffic
+    stays constant no matter how many cards are open. The snapshot is
+    refreshed on demand once it is older than QUEUE_SCAN_INTERVAL, and on
+    that schedule while anything is listening to the coordinator.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: RequestarrCoordinator,
+    ) -> None:
+        """Initialize the queue coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_queue",
+            update_interval=timedelta(seconds=QUEUE_SCAN_INTERVAL),
+        )
+        self.config_entry = entry
+        self._coordinator = coordinator
+        self._refresh_lock = asyncio.Lock()
+        self._last_refresh: float | None = None
+
+    async def async_get_items(self) -> list[dict[str, Any]]:
+        """Return the normalized queue, refreshing it first if it is stale.
+
+        Concurrent callers that find the snapshot stale share one refresh.
+        """
+        if self._is_stale():
+            async with self._refresh_lock:
+                if self._is_stale():
+                    await self.async_refresh()
+        return (self.data or {}).get("items", [])
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Mark the snapshot stale after an arr reported a queue change.
+
+        The next get_queue refetches; subscribers get a refresh right away.
+        """
+        self._last_refresh = None
+        if self._listeners:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN} queue refresh"
+            )
+
+    @callback
+    def async_remove_item(self, service_type: str, queue_id: int) -> None:
+        """Drop a deleted item from the snapshot and notify listeners."""
+        if not self.data:
+            return
+        items = [
+            item
+            for item in self.data["items"]
+            if not (item["service"] == service_type and item["queue_id"] == queue_id)
+        ]
+        self.async_set_updated_data({**self.data, "items": items})
+
+    def _is_stale(self) -> bool:
+        """Return True if the snapshot is missing or older than the interval."""
+        return (
+            self._last_refresh is None
+            or time.monotonic() - self._last_refresh >= QUEUE_SCAN_INTERVAL
+        )
+
+    async def _async_fetch_queue(self, service_type: str) -> list[dict[str, Any]]:
+        """Fetch one service's full queue, normalizing each page as it arrives."""
+        client = self._coordinator.get_client(service_type)
+        items: list[dict[str, Any]] = []
+        async for page in client.async_iter_queue():
+            items.extend(_normalize_queue_item(record, service_type) for record in page)
+        return items
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch and normalize the queue of every configured arr service.
+
+        Returns a dict with:
+        - items: normalized queue items across all services
+        - errors: dict of service_type -> error message for failed services
+
+        Unavailable services are skipped rather than failing the refresh.
+        """
+        services = self._coordinator.configured_services
+        with background_requests():
+            results = await asyncio.gather(
+                *(self._async_fetch_queue(service_type) for service_type in services),
+                return_exceptions=True,
+            )
+
+        items: list[dict[str, Any]] = []
+        errors: dict[str, str] = {}
+        for service_type, result in zip(services, results):
+            if isinstance(
+                result, (CannotConnectError, InvalidAuthError, ServerError)
+            ):
+                _LOGGER.debug(
+                    "Failed to fetch %s queue: %s", service_type, result
+                )
+                errors[service_type] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                items.extend(result)
+
+        self._last_refresh = time.monotonic()
+        self._coordinator.async_set_queue_active({item["service"] for item in items})
+        return {"items": items, "errors": errors}
@@ -57,22 +57,34 @@ class RequestarrCard extends LitElement {
     this._toastMessage = "";
     this._toastTimer = null;
     this._queueTimer = null;
+    this._queueUnsub = null;
     this._debounceTimer = null;
     this._searchSeq = 0;
+    this._searchUnsub = null;
   }
 
   connectedCallback() {
     super.connectedCallback();
-    this._fetchQueue();
-    this._queueTimer = setInterval(() => this._fetchQueue(), 10000);
+    this._subscribeQueue();
+  }
+
+  updated(changedProps) {
+    super.updated(changedProps);
+    // hass may arrive after the card is attached
+    if (changedProps.has("hass")) this._subscribeQueue();
   }
 
   disconnectedCallback() {
     super.disconnectedCallback();
+    if (this._queueUnsub) {
+      this._queueUnsub.then((unsub) => unsub()).catch(() => {});
+      this._queueUnsub = null;
+    }
     if (this._queueTimer) {
       clearInterval(this._queueTimer);
       this._queueTimer = null;
     }
+    this._cancelSearch();
     if (this._toastTimer) {
       clearTimeout(this._toastTimer);
       this._toastTimer = null;
@@ -121,8 +133,10 @@ class RequestarrCard extends LitElement {
     this._query = e.target.value;
     if (this._activeTab === "downloads") return; // local filter only
     clearTimeout(this._debounceTimer);
+    this._cancelSearch();
     if (this._query.length < 2) {
       this._results = [];
+      this._loading = false;
       return;
     }
     this._debounceTimer = setTimeout(() => this._doSearch(), 300);
@@ -131,6 +145,8 @@ class RequestarrCard extends LitElement {
   _switchTab(tab) {
     if (this._activeTab === tab) return;
     this._activeTab = tab;
+    this._cancelSearch();
+    this._loading = false;
     if (tab === "downloads") return; // no search needed for queue view
     this._results = [];
     if (this._query.length >= 2) {
@@ -143,31 +159,53 @@ class RequestarrCard extends LitElement {
   // Search
   // ---------------------------------------------------------------------------
 
-  async _doSearch() {
+  _doSearch() {
     const type =
       this._activeTab === "movies"
         ? "requestarr/search_movies"
         : this._activeTab === "tv"
         ? "requestarr/search_tv"
         : "requestarr/search_music";
-    const seq = ++this._searchSeq;
+    this._cancelSearch();
+    const seq = this._searchSeq;
     this._loading = true;
-    try {
-      const resp = await this.hass.connection.sendMessagePromise({
-        type,
-        query: this._query,
-      });
-      if (seq !== this._searchSeq) return;
-      this._results = resp.results || [];
-      // Reset expand state for fresh results
-      this._expandedRows = {};
-      this._albumCache = {};
-      this._albumLoading = {};
-    } catch (_err) {
+    // Lookup results arrive first; library status corrections follow as patches
+    this._searchUnsub = this.hass.connection.subscribeMessage(
+      (msg) => {
+        if (seq !== this._searchSeq) return;
+        if (msg.results) {
+          this._results = msg.results;
+          // Reset expand state for fresh results
+          this._expandedRows = {};
+          this._albumCache = {};
+          this._albumLoading = {};
+          this._loading = false;
+        } else if (msg.patch) {
+          const { index, ...fields } = msg.patch;
+          this._results = this._results.map((r, i) => (i === index ? { ...r, ...fields } : r));
+        } else if (msg.error) {
+          this._results = [];
+          this._loading = false;
+        } else if (msg.done) {
+          this._cancelSearch();
+        }
+      },
+      { type, query: this._query, stream: true }
+    );
+    this._searchUnsub.catch(() => {
       if (seq !== this._searchSeq) return;
+      this._searchUnsub = null;
       this._results = [];
-    } finally {
-      if (seq === this._searchSeq) this._loading = false;
+      this._loading = false;
+    });
+  }
+
+  _cancelSearch() {
+    // Invalidate the running search; unsubscribing cancels it on the backend
+    ++this._searchSeq;
+    if (this._searchUnsub) {
+      this._searchUnsub.then((unsub) => unsub()).catch(() => {});
+      this._searchUnsub = null;
     }
   }
 
@@ -201,6 +239,37 @@ class RequestarrCard extends LitElement {
   // Queue
   // ---------------------------------------------------------------------------
 
+  _subscribeQueue() {
+    if (!this.hass || !this.isConnected || this._queueUnsub || this._queueTimer) return;
+    this._queueUnsub = this.hass.connection.subscribeMessage(
+      (msg) => this._applyQueueMessage(msg),
+      { type: "requestarr/subscribe_queue" }
+    );
+    this._queueUnsub.catch(() => {
+      // Backend without queue subscriptions — fall back to polling
+      this._queueUnsub = null;
+      if (!this.isConnected || this._queueTimer) return;
+      this._fetchQueue();
+      this._queueTimer = setInterval(() => this._fetchQueue(), 10000);
+    });
+  }
+
+  _applyQueueMessage(msg) {
+    if (msg.items) {
+      this._queueData = msg.items;
+      return;
+    }
+    const key = (q) => `${q.service}:${q.queue_id}`;
+    const removed = new Set((msg.removed || []).map(key));
+    const updates = new Map((msg.updated || []).map((u) => [key(u), u]));
+    this._queueData = [
+      ...this._queueData
+        .filter((q) => !removed.has(key(q)))
+        .map((q) => (updates.has(key(q)) ? { ...q, ...updates.get(key(q)) } : q)),
+      ...(msg.added || []),
+    ];
+  }
+
   async _fetchQueue() {
     if (!this.hass) return;
     try {
@@ -255,7 +324,9 @@ class RequestarrCard extends LitElement {
         queue_id: queueId,
         service,
       });
-      this._queueData = this._queueData.filter((q) => q.queue_id !== queueId);
+      this._queueData = this._queueData.filter(
+        (q) => !(q.queue_id === queueId && q.service === service)
+      );
     } catch (_err) {
       // silently ignore
     }
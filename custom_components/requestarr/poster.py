@@ -0,0 +1,267 @@
+"""Poster proxy for Requestarr — small, locally cached search result images.
+
+Search results point at TMDB, TheTVDB and fanart.tv originals, which can be
+several megabytes each. Results instead get a signed URL on this view, which
+fetches each poster once, downscales it (when Pillow is available) and keeps
+it in a size-bounded LRU directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import io
+import logging
+import mimetypes
+import secrets
+from collections import OrderedDict
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import quote
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    POSTER_FETCH_TIMEOUT,
+    POSTER_JPEG_QUALITY,
+    POSTER_MAX_SOURCE_BYTES,
+    POSTER_PROXY_URL,
+    POSTER_WIDTH,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Signs proxied URLs so the view only fetches posters Requestarr handed out.
+# Replaced by the persisted key at setup, so signed URLs survive restarts.
+_signing_key = secrets.token_bytes(32)
+
+_CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+
+def _cache_key(url: str) -> str:
+    """Return the stable on-disk key (and ETag) for a remote poster URL."""
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+
+def _sign(url: str) -> str:
+    return hmac.new(_signing_key, url.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+async def async_load_signing_key(hass: HomeAssistant) -> None:
+    """Load the URL signing key from storage, creating it on first run."""
+    global _signing_key  # noqa: PLW0603
+    store: Store[dict[str, str]] = Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY}.poster_key", private=True
+    )
+    stored = await store.async_load()
+    if stored and "key" in stored:
+        _signing_key = bytes.fromhex(stored["key"])
+        return
+    await store.async_save({"key": _signing_key.hex()})
+
+
+def proxy_poster_url(url: str | None) -> str | None:
+    """Return the local proxy URL for a remote poster, or None."""
+    if not url:
+        return None
+    return f"{POSTER_PROXY_URL}/{_sign(url)}?url={quote(url, safe='')}"
+
+
+def _downscale(body: bytes) -> bytes | None:
+    """Shrink an image to POSTER_WIDTH wide as JPEG, or None if not possible."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            image.thumbnail((POSTER_WIDTH, POSTER_WIDTH * 3))
+            out = io.BytesIO()
+            image.convert("RGB").save(
+                out, "JPEG", quality=POSTER_JPEG_QUALITY, optimize=True
+            )
+    except Exception as err:  # noqa: BLE001
+        # Decompression bombs and plugin decode errors are not all OSError
+        _LOGGER.debug("Cannot downscale poster: %s", err)
+        return None
+    return out.getvalue()
+
+
+class PosterCache:
+    """Size-bounded LRU of downscaled posters stored in one directory.
+
+    The index (key -> file name and size, least recently used first) is
+    built from the directory on first use, ordered by modification time;
+    hits touch their file so the order survives restarts. Concurrent
+    misses for the same poster share one download.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: Path, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._files: OrderedDict[str, tuple[str, int]] | None = None
+        self._total = 0
+        self._load_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Task[tuple[str, bytes] | None]] = {}
+
+    def _scan(self) -> list[tuple[str, int]]:
+        """Create the directory and list its files, oldest first."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        stats = [
+            (path.name, path.stat())
+            for path in self._directory.iterdir()
+            if path.is_file() and not path.name.endswith(".tmp")
+        ]
+        stats.sort(key=lambda item: item[1].st_mtime)
+        return [(name, stat.st_size) for name, stat in stats]
+
+    async def _async_index(self) -> OrderedDict[str, tuple[str, int]]:
+        if self._files is None:
+            async with self._load_lock:
+                if self._files is None:
+                    entries = await self._hass.async_add_executor_job(self._scan)
+                    self._files = OrderedDict(
+                        (name.split(".", 1)[0], (name, size)) for name, size in entries
+                    )
+                    self._total = sum(size for _, size in self._files.values())
+        return self._files
+
+    def _read(self, name: str) -> bytes:
+        path = self._directory / name
+        path.touch()
+        return path.read_bytes()
+
+    def _write(self, name: str, body: bytes) -> None:
+        tmp = self._directory / f"{name}.tmp"
+        tmp.write_bytes(body)
+        tmp.replace(self._directory / name)
+
+    def _remove(self, names: list[str]) -> None:
+        """Delete evicted files; each is attempted even if another fails."""
+        for name in names:
+            try:
+                (self._directory / name).unlink(missing_ok=True)
+            except OSError as err:
+                _LOGGER.warning("Failed to evict poster %s: %s", name, err)
+
+    async def async_get(self, url: str) -> tuple[str, bytes] | None:
+        """Return (file name, body) for a poster, fetching it on a miss.
+
+        Returns None if the poster cannot be fetched.
+        """
+        files = await self._async_index()
+        key = _cache_key(url)
+        if key in files:
+            name, _ = files[key]
+            files.move_to_end(key)
+            try:
+                return name, await self._hass.async_add_executor_job(self._read, name)
+            except OSError:
+                _, size = files.pop(key)
+                self._total -= size
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._hass.async_create_task(self._async_fetch(key, url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, key: str, url: str) -> tuple[str, bytes] | None:
+        """Download, downscale and store one poster."""
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=POSTER_FETCH_TIMEOUT)
+            ) as resp:
+                if resp.status != HTTPStatus.OK or not resp.content_type.startswith(
+                    "image/"
+                ):
+                    return None
+                content_type = resp.content_type
+                body = bytearray()
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) > POSTER_MAX_SOURCE_BYTES:
+                        return None
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Failed to fetch poster %s: %s", url, err)
+            return None
+
+        small = await self._hass.async_add_executor_job(_downscale, bytes(body))
+        if small is not None:
+            name, data = f"{key}.jpg", small
+        else:
+            ext = mimetypes.guess_extension(content_type) or ".img"
+            name, data = f"{key}{ext}", bytes(body)
+
+        try:
+            await self._hass.async_add_executor_job(self._write, name, data)
+        except OSError as err:
+            _LOGGER.warning("Failed to cache poster %s: %s", name, err)
+            return name, data
+
+        files = await self._async_index()
+        if key in files:
+            self._total -= files[key][1]
+        files[key] = (name, len(data))
+        files.move_to_end(key)
+        self._total += len(data)
+        evict: list[str] = []
+        while self._total > self._max_bytes and len(files) > 1:
+            _, (old_name, size) = files.popitem(last=False)
+            self._total -= size
+            evict.append(old_name)
+        if evict:
+            await self._hass.async_add_executor_job(self._remove, evict)
+        return name, data
+
+
+class PosterView(HomeAssistantView):
+    """Serve proxied posters from the on-disk cache."""
+
+    url = f"{POSTER_PROXY_URL}/{{signature}}"
+    name = f"api:{DOMAIN}:poster"
+    # <img> tags cannot send auth headers; URLs are signed instead
+    requires_auth = False
+
+    def __init__(self, cache: PosterCache) -> None:
+        """Initialize the view."""
+        self._cache = cache
+
+    async def get(self, request: web.Request, signature: str) -> web.StreamResponse:
+        """Return a cached poster, fetching it on first request."""
+        url = request.query.get("url", "")
+        if not url or not hmac.compare_digest(signature, _sign(url)):
+            return web.Response(status=HTTPStatus.FORBIDDEN)
+
+        # The content behind a URL never changes, so its key is the ETag
+        headers = {**_CACHE_HEADERS, "ETag": f'"{_cache_key(url)}"'}
+        if headers["ETag"] in request.headers.get("If-None-Match", ""):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        poster = await self._cache.async_get(url)
+        if poster is None:
+            # Let the browser try the original rather than show nothing
+            raise web.HTTPFound(url)
+        name, body = poster
+        return web.Response(
+            body=body,
+            content_type=mimetypes.guess_type(name)[0] or "application/octet-stream",
+            headers=headers,
+        )
@@ -0,0 +1,183 @@
+"""Failure handling primitives for Requestarr's arr API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from .const import (
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_DEADLINE,
+    RETRY_MAX_DELAY,
+)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class CircuitBreaker:
+    """Fail fast while an arr service is unreachable.
+
+    After `failure_threshold` consecutive connection failures the circuit
+    opens and requests are rejected immediately. Once `reset_timeout`
+    seconds have passed, a single half-open probe is let through: success
+    closes the circuit, failure opens it for another cool-down window.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the breaker in the closed state."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if (
+            self._state == CIRCUIT_OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            return CIRCUIT_HALF_OPEN
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until the next probe is allowed (0 if not open)."""
+        if self._state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return True
+        if state == CIRCUIT_OPEN or self._probe_in_flight:
+            return False
+        self._state = CIRCUIT_HALF_OPEN
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record that the service answered; close the circuit."""
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a connection failure; open the circuit at the threshold."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if (
+            self._state == CIRCUIT_HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            self._state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Forget an allowed request that ended without an outcome."""
+        self._probe_in_flight = False
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Retry schedule for idempotent requests.
+
+    Delays grow exponentially from base_delay, capped at max_delay, with
+    full jitter so concurrent callers do not retry in lockstep. No retry is
+    started once it could not finish within `deadline` seconds of the first
+    attempt.
+    """
+
+    attempts: int = RETRY_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    deadline: float = RETRY_DEADLINE
+
+    def delay(self, retry: int) -> float:
+        """Return a jittered delay in seconds before the given retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class PriorityLimiter:
+    """Cap concurrent requests to one service, serving higher priority first.
+
+    When every slot is busy, waiters are queued by priority (interactive
+    before background) and then in arrival order. Time spent waiting for a
+    slot is recorded for diagnostics.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter with `limit` concurrent slots."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.wait_count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """Return the mean time in seconds a request waited for a slot."""
+        return self.total_wait / self.wait_count if self.wait_count else 0.0
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for a free slot."""
+        started = time.monotonic()
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+        else:
+            future: asyncio.Future[None] = (
+                asyncio.get_running_loop().create_future()
+            )
+            heapq.heappush(
+                self._waiters, (priority, next(self._sequence), future)
+            )
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # A slot was handed over just as we were cancelled
+                    self._release()
+                else:
+                    future.cancel()  # skipped by _release
+                raise
+        waited = time.monotonic() - started
+        self.wait_count += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _release(self) -> None:
+        """Hand the slot to the next live waiter, or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
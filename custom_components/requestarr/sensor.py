@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.components import webhook
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -64,8 +66,10 @@ async def async_setup_entry(
 class RequestarrSensor(CoordinatorEntity[RequestarrCoordinator], SensorEntity):
     """Sensor showing arr service status with library count as attribute.
 
-    State: connected | disconnected | error
-    Attributes: library_count, service_url, last_successful_sync
+    State: connected | disconnected | error (unknown until the first poll
+    after starting from a saved snapshot)
+    Attributes: library_count, service_url, last_successful_sync,
+    circuit_state, retries, avg_request_wait, webhook_path, restored
     """
 
     _attr_has_entity_name = True
@@ -87,6 +91,8 @@ class RequestarrSensor(CoordinatorEntity[RequestarrCoordinator], SensorEntity):
 
         # Store the service URL for attributes (base URL only, no secrets)
         self._service_url = entry.data.get(config["url_key"], "")
+        # Where this arr's Connect → Webhook notification should POST
+        self._webhook_path = webhook.async_generate_path(entry.data[CONF_WEBHOOK_ID])
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -98,7 +104,7 @@ class RequestarrSensor(CoordinatorEntity[RequestarrCoordinator], SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the service status: connected, disconnected, or error."""
-        if self.coordinator.data is None:
+        if self.coordinator.data is None or self.coordinator.data.get("restored"):
             return None
 
         errors = self.coordinator.data.get("errors", {})
@@ -121,4 +127,9 @@ class RequestarrSensor(CoordinatorEntity[RequestarrCoordinator], SensorEntity):
             "last_successful_sync": data.get(
                 f"{self._service_type}_last_sync"
             ),
+            "circuit_state": data.get(f"{self._service_type}_circuit"),
+            "retries": data.get(f"{self._service_type}_retries"),
+            "avg_request_wait": data.get(f"{self._service_type}_avg_wait"),
+            "webhook_path": self._webhook_path,
+            "restored": data.get("restored", False),
         }
@@ -0,0 +1,159 @@
+"""Arr Connect webhook receiver for Requestarr.
+
+Radarr, Sonarr and Lidarr can POST their Connect events to Home Assistant.
+Library events are applied straight to the coordinator data and library
+index, and queue events mark the shared queue snapshot stale, so polling
+of a service that pushes its library events only has to act as a slow
+consistency backstop.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    SERVICE_LIDARR,
+    SERVICE_SONARR,
+    WEBHOOK_EVENTS_ADDED,
+    WEBHOOK_EVENTS_DELETED,
+    WEBHOOK_EVENTS_FILE_DELETED,
+    WEBHOOK_EVENTS_QUEUE,
+    WEBHOOK_MEDIA_KEYS,
+)
+
+if TYPE_CHECKING:
+    from . import RequestarrConfigEntry, RequestarrData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_webhook(hass: HomeAssistant, entry: RequestarrConfigEntry) -> None:
+    """Register the entry's webhook; it is unregistered on unload."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if isinstance(payload, dict):
+            async_handle_event(entry.runtime_data, payload)
+        return web.Response(status=HTTPStatus.OK)
+
+    webhook.async_register(
+        hass, DOMAIN, "Requestarr", webhook_id, _async_handle_webhook, local_only=True
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+
+
+def _service_for_payload(payload: dict[str, Any]) -> str | None:
+    """Return which arr sent a payload, judged by its media object."""
+    for service_type, (media_key, _) in WEBHOOK_MEDIA_KEYS.items():
+        if isinstance(payload.get(media_key), dict):
+            return service_type
+    return None
+
+
+def _apply_file_change(
+    entry: dict[str, Any],
+    service_type: str,
+    payload: dict[str, Any],
+    downloaded: bool,
+) -> None:
+    """Update has_file (and Sonarr season stats) for a file import or delete.
+
+    Upgrades replace an existing file, so they leave the counts alone.
+    """
+    if payload.get("isUpgrade") or payload.get("deleteReason") == "upgrade":
+        return
+    if service_type != SERVICE_SONARR:
+        entry["has_file"] = downloaded
+        return
+
+    per_season = Counter(
+        episode.get("seasonNumber") for episode in payload.get("episodes") or []
+    )
+    for season in entry.get("seasons", []):
+        changed = per_season.get(season["seasonNumber"], 0)
+        if not changed:
+            continue
+        stats = season["statistics"]
+        files = stats["episodeFileCount"] + (changed if downloaded else -changed)
+        cap = stats["totalEpisodeCount"] or files
+        stats["episodeFileCount"] = max(0, min(files, cap))
+    if downloaded:
+        entry["has_file"] = True
+    elif entry.get("seasons"):
+        entry["has_file"] = any(
+            season["statistics"]["episodeFileCount"] > 0
+            for season in entry["seasons"]
+        )
+
+
+@callback
+def async_handle_event(data: RequestarrData, payload: dict[str, Any]) -> None:
+    """Apply one arr Connect event to the coordinators and library index."""
+    service_type = _service_for_payload(payload)
+    client = data.coordinator.get_client(service_type) if service_type else None
+    if client is None:
+        return
+
+    event_type = payload.get("eventType")
+    _LOGGER.debug("Received %s webhook event %s", service_type, event_type)
+
+    if event_type in WEBHOOK_EVENTS_QUEUE:
+        data.queue_coordinator.async_invalidate()
+
+    media_key, id_key = WEBHOOK_MEDIA_KEYS[service_type]
+    media = payload[media_key]
+    external_id = media.get(id_key)
+    if external_id is None or media.get("id") is None:
+        return
+
+    index = client.library_index
+    count_delta = 0
+    if event_type in WEBHOOK_EVENTS_ADDED:
+        if external_id not in index:
+            count_delta = 1
+        entry: dict[str, Any] = {
+            "id": media["id"],
+            "monitored": media.get("monitored", True),
+            "has_file": False,
+        }
+        if service_type == SERVICE_SONARR:
+            entry["seasons"] = []
+        index[external_id] = entry
+    elif event_type in WEBHOOK_EVENTS_DELETED:
+        if index.pop(external_id, None) is not None:
+            count_delta = -1
+    elif event_type == "Download" or event_type in WEBHOOK_EVENTS_FILE_DELETED:
+        if external_id in index:
+            _apply_file_change(
+                index[external_id],
+                service_type,
+                payload,
+                downloaded=event_type == "Download",
+            )
+    else:
+        return
+
+    # Only a library event (not Test or Grab) shows this arr's library
+    # triggers are enabled, so its polling can slow down
+    data.coordinator.async_use_push_updates(service_type)
+    client.invalidate_search(external_id)
+    if service_type == SERVICE_LIDARR:
+        client.invalidate_albums(external_id)
+    data.coordinator.async_apply_library_change(service_type, count_delta)
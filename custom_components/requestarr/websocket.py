@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Callable, Coroutine, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 
-from .api import CannotConnectError, InvalidAuthError, ServerError
+from .api import (
+    ArrClient,
+    CannotConnectError,
+    InvalidAuthError,
+    ServerError,
+    _library_index_entry,
+)
 from .const import (
-    ARR_SERVICES,
     CONF_LIDARR_METADATA_PROFILE_ID,
     CONF_LIDARR_METADATA_PROFILES,
     CONF_LIDARR_QUALITY_PROFILE_ID,
@@ -28,6 +36,8 @@ from .const import (
     CONF_SONARR_PROFILES,
     CONF_SONARR_FOLDERS,
     DOMAIN,
+    MAX_BATCH_REQUESTS,
+    MAX_ENRICH_CONCURRENCY,
     MAX_SEARCH_RESULTS,
     SERVICE_LIDARR,
     SERVICE_RADARR,
@@ -38,17 +48,23 @@ from .const import (
     WS_TYPE_GET_ARTIST_ALBUMS,
     WS_TYPE_REQUEST_ALBUM,
     WS_TYPE_REQUEST_ARTIST,
+    WS_TYPE_REQUEST_BATCH,
     WS_TYPE_REQUEST_MOVIE,
     WS_TYPE_REQUEST_TV,
+    WS_TYPE_SEARCH_ALL,
     WS_TYPE_SEARCH_MOVIES,
     WS_TYPE_SEARCH_MUSIC,
     WS_TYPE_SEARCH_TV,
+    WS_TYPE_SUBSCRIBE_QUEUE,
 )
+from .poster import proxy_poster_url
 
 _LOGGER = logging.getLogger(__name__)
 
 WS_TYPE_GET_DATA = f"{DOMAIN}/get_data"
 
+_T = TypeVar("_T")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -63,12 +79,30 @@ def _get_coordinator(hass: HomeAssistant):
     return entries[0].runtime_data.coordinator
 
 
-def _get_config_data(hass: HomeAssistant) -> dict[str, Any]:
-    """Return the config entry data dict, or empty dict."""
+def _get_queue_coordinator(hass: HomeAssistant):
+    """Return the RequestarrQueueCoordinator, or None if not configured."""
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        return None
+    return entries[0].runtime_data.queue_coordinator
+
+
+def _get_config_data(hass: HomeAssistant) -> Mapping[str, Any]:
+    """Return the config entry data (read-only), or empty dict."""
     entries = hass.config_entries.async_entries(DOMAIN)
     if not entries:
         return {}
-    return dict(entries[0].data)
+    return entries[0].data
+
+
+def _get_service_defaults(hass: HomeAssistant, service_type: str) -> ServiceDefaults:
+    """Return the precompiled result defaults for one service."""
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        return ServiceDefaults()
+    return entries[0].runtime_data.service_defaults.get(
+        service_type, ServiceDefaults()
+    )
 
 
 def _resolve_profile_name(
@@ -89,6 +123,50 @@ def _resolve_profile_name(
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, slots=True)
+class ServiceDefaults:
+    """Display fields shared by every search result of one service.
+
+    Resolved from the entry's stored profiles once per setup (the options
+    flow reloads the entry), so normalizing a result is field projection.
+    """
+
+    quality_profile: str = ""
+    root_folder: str = ""
+    metadata_profile: str = ""
+
+
+def build_service_defaults(data: Mapping[str, Any]) -> dict[str, ServiceDefaults]:
+    """Resolve each service's configured profile names and root folder."""
+    return {
+        SERVICE_RADARR: ServiceDefaults(
+            quality_profile=_resolve_profile_name(
+                data.get(CONF_RADARR_PROFILES, []),
+                data.get(CONF_RADARR_QUALITY_PROFILE_ID),
+            ),
+            root_folder=data.get(CONF_RADARR_ROOT_FOLDER, ""),
+        ),
+        SERVICE_SONARR: ServiceDefaults(
+            quality_profile=_resolve_profile_name(
+                data.get(CONF_SONARR_PROFILES, []),
+                data.get(CONF_SONARR_QUALITY_PROFILE_ID),
+            ),
+            root_folder=data.get(CONF_SONARR_ROOT_FOLDER, ""),
+        ),
+        SERVICE_LIDARR: ServiceDefaults(
+            quality_profile=_resolve_profile_name(
+                data.get(CONF_LIDARR_PROFILES, []),
+                data.get(CONF_LIDARR_QUALITY_PROFILE_ID),
+            ),
+            root_folder=data.get(CONF_LIDARR_ROOT_FOLDER, ""),
+            metadata_profile=_resolve_profile_name(
+                data.get(CONF_LIDARR_METADATA_PROFILES, []),
+                data.get(CONF_LIDARR_METADATA_PROFILE_ID),
+            ),
+        ),
+    }
+
+
 def _extract_poster_url(
     item: dict[str, Any], cover_type: str = "poster"
 ) -> str | None:
@@ -119,10 +197,10 @@ def _rewrite_tmdb_poster(url: str | None) -> str | None:
 
 
 def _normalize_movie_result(
-    item: dict[str, Any], config_data: dict[str, Any]
+    item: dict[str, Any], defaults: ServiceDefaults
 ) -> dict[str, Any]:
     """Normalize a Radarr movie lookup result into a standard search result."""
-    poster_url = _rewrite_tmdb_poster(_extract_poster_url(item))
+    poster_url = proxy_poster_url(_rewrite_tmdb_poster(_extract_poster_url(item)))
     arr_id = item.get("id", 0)
 
     return {
@@ -135,20 +213,17 @@ def _normalize_movie_result(
         "tmdb_id": item.get("tmdbId"),
         "title_slug": item.get("titleSlug", ""),
         "has_file": item.get("hasFile", False),
-        "quality_profile": _resolve_profile_name(
-            config_data.get(CONF_RADARR_PROFILES, []),
-            config_data.get(CONF_RADARR_QUALITY_PROFILE_ID),
-        ),
-        "root_folder": config_data.get(CONF_RADARR_ROOT_FOLDER, ""),
+        "quality_profile": defaults.quality_profile,
+        "root_folder": defaults.root_folder,
     }
 
 
 def _normalize_tv_result(
-    item: dict[str, Any], config_data: dict[str, Any]
+    item: dict[str, Any], defaults: ServiceDefaults
 ) -> dict[str, Any]:
     """Normalize a Sonarr series lookup result into a standard search result."""
-    poster_url = _extract_poster_url(item)
-    # TheTVDB URLs pass through unchanged (no rewriting needed)
+    # TheTVDB posters are full size; the proxy serves a downscaled copy
+    poster_url = proxy_poster_url(_extract_poster_url(item))
     arr_id = item.get("id", 0)
 
     return {
@@ -162,20 +237,17 @@ def _normalize_tv_result(
         "title_slug": item.get("titleSlug", ""),
         "has_file": False,  # Sonarr lookup statistics always 0 (issue #4942)
         "seasons": item.get("seasons", []),  # pass raw seasons list through
-        "quality_profile": _resolve_profile_name(
-            config_data.get(CONF_SONARR_PROFILES, []),
-            config_data.get(CONF_SONARR_QUALITY_PROFILE_ID),
-        ),
-        "root_folder": config_data.get(CONF_SONARR_ROOT_FOLDER, ""),
+        "quality_profile": defaults.quality_profile,
+        "root_folder": defaults.root_folder,
     }
 
 
 def _normalize_music_result(
-    item: dict[str, Any], config_data: dict[str, Any]
+    item: dict[str, Any], defaults: ServiceDefaults
 ) -> dict[str, Any]:
     """Normalize a Lidarr artist lookup result into a standard search result."""
-    poster_url = _extract_poster_url(item)
-    # fanart.tv URLs pass through unchanged (no rewriting needed)
+    # fanart.tv posters are full size; the proxy serves a downscaled copy
+    poster_url = proxy_poster_url(_extract_poster_url(item))
     arr_id = item.get("id", 0)
 
     return {
@@ -186,93 +258,494 @@ def _normalize_music_result(
         "in_library": arr_id > 0,
         "arr_id": arr_id if arr_id > 0 else None,
         "foreign_artist_id": item.get("foreignArtistId"),
-        "quality_profile": _resolve_profile_name(
-            config_data.get(CONF_LIDARR_PROFILES, []),
-            config_data.get(CONF_LIDARR_QUALITY_PROFILE_ID),
-        ),
-        "metadata_profile": _resolve_profile_name(
-            config_data.get(CONF_LIDARR_METADATA_PROFILES, []),
-            config_data.get(CONF_LIDARR_METADATA_PROFILE_ID),
-        ),
-        "root_folder": config_data.get(CONF_LIDARR_ROOT_FOLDER, ""),
+        "quality_profile": defaults.quality_profile,
+        "metadata_profile": defaults.metadata_profile,
+        "root_folder": defaults.root_folder,
     }
 
 
+# ---------------------------------------------------------------------------
+# Search result enrichment
+# ---------------------------------------------------------------------------
+
+
+async def _gather_limited(
+    coros: list[Coroutine[Any, Any, _T]], limit: int
+) -> list[_T]:
+    """Run coroutines concurrently, at most `limit` at a time, in input order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(coro) for coro in coros))
+
+
+def _enrich_movies(
+    coordinator,
+    client: ArrClient,
+    results: list[dict[str, Any]],
+    on_patch: Callable[[int, dict[str, Any]], None] | None = None,
+) -> list[Coroutine[Any, Any, None]]:
+    """Fill in accurate has_file for in-library movie results, in place.
+
+    The lookup endpoint does not populate hasFile, so library index hits are
+    applied right away. Items added since the last poll need /movie/{id};
+    those fetches are returned for the caller to run (capped per search),
+    and each reports its change through on_patch(index, fields).
+    """
+
+    async def _fetch(index: int, normalized: dict[str, Any]) -> None:
+        try:
+            movie_data = await client.async_get_movie(normalized["arr_id"])
+        except (CannotConnectError, InvalidAuthError, ServerError):
+            return  # keep default has_file=False as fallback
+        if movie_data:
+            normalized["has_file"] = movie_data.get("hasFile", False)
+            if on_patch is not None:
+                on_patch(index, {"has_file": normalized["has_file"]})
+
+    pending = []
+    for index, normalized in enumerate(results):
+        if normalized["arr_id"] is None:
+            continue
+        entry = coordinator.get_library_entry(SERVICE_RADARR, normalized["tmdb_id"])
+        if entry is not None and entry["id"] == normalized["arr_id"]:
+            normalized["has_file"] = entry["has_file"]
+        else:
+            pending.append(_fetch(index, normalized))
+    return pending
+
+
+def _enrich_tv(
+    coordinator,
+    client: ArrClient,
+    results: list[dict[str, Any]],
+    on_patch: Callable[[int, dict[str, Any]], None] | None = None,
+) -> list[Coroutine[Any, Any, None]]:
+    """Fill in accurate season statistics for in-library TV results, in place.
+
+    The lookup endpoint does not populate statistics.episodeFileCount, so
+    per-season library status comes from the coordinator's library index.
+    Series added since the last poll, or pushed by a SeriesAdd webhook
+    without season stats, need /series/{id}; those fetches are returned for
+    the caller to run, each reporting through on_patch.
+    """
+
+    async def _fetch(index: int, normalized: dict[str, Any]) -> None:
+        try:
+            accurate_seasons = await client.async_get_series_seasons(
+                normalized["arr_id"]
+            )
+        except (CannotConnectError, InvalidAuthError, ServerError):
+            return  # keep lookup seasons as fallback
+        if not accurate_seasons:
+            return
+        normalized["seasons"] = accurate_seasons
+        # Backfill a pushed entry so later Download events can count files
+        entry = coordinator.get_library_entry(SERVICE_SONARR, normalized["tvdb_id"])
+        if entry is not None and entry["id"] == normalized["arr_id"]:
+            entry["seasons"] = _library_index_entry(
+                {"seasons": accurate_seasons}, SERVICE_SONARR
+            )["seasons"]
+        if on_patch is not None:
+            on_patch(index, {"seasons": accurate_seasons})
+
+    pending = []
+    for index, normalized in enumerate(results):
+        if normalized["arr_id"] is None:
+            continue
+        entry = coordinator.get_library_entry(SERVICE_SONARR, normalized["tvdb_id"])
+        if (
+            entry is not None
+            and entry["id"] == normalized["arr_id"]
+            and entry["seasons"]
+        ):
+            normalized["seasons"] = entry["seasons"]
+        else:
+            pending.append(_fetch(index, normalized))
+    return pending
+
+
 # ---------------------------------------------------------------------------
 # Generic search handler
 # ---------------------------------------------------------------------------
 
 
+async def _async_search_service(
+    coordinator,
+    client: ArrClient,
+    service_type: str,
+    query: str,
+    defaults: ServiceDefaults,
+) -> list[dict[str, Any]]:
+    """Look up, normalize and enrich one service's results for a query.
+
+    Raises:
+        CannotConnectError, InvalidAuthError, ServerError: From the lookup.
+    """
+    raw_results = await client.async_search(query)
+    results = [
+        _SEARCH_NORMALIZERS[service_type](item, defaults)
+        for item in raw_results[:MAX_SEARCH_RESULTS]
+    ]
+    enrich = _SEARCH_ENRICHERS.get(service_type)
+    if enrich is not None:
+        await _gather_limited(
+            enrich(coordinator, client, results), MAX_ENRICH_CONCURRENCY
+        )
+    return results
+
+
+_SEARCH_NORMALIZERS = {
+    SERVICE_RADARR: _normalize_movie_result,
+    SERVICE_SONARR: _normalize_tv_result,
+    SERVICE_LIDARR: _normalize_music_result,
+}
+_SEARCH_ENRICHERS = {
+    SERVICE_RADARR: _enrich_movies,
+    SERVICE_SONARR: _enrich_tv,
+}
+
+
+def _send_search_error(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    error: str,
+    message: str,
+) -> None:
+    """Report a search failure the way the request's mode expects.
+
+    Plain searches answer with an empty result set carrying the error;
+    streaming searches fail with an error before the subscription opens.
+    """
+    if msg.get("stream"):
+        connection.send_error(msg["id"], error, message)
+    else:
+        connection.send_result(
+            msg["id"], {"error": error, "message": message, "results": []}
+        )
+
+
+def _open_search_subscription(
+    connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> Callable[[dict[str, Any]], None]:
+    """Open a search subscription and return a function that sends events.
+
+    Unsubscribing (or the connection closing) cancels the handler task, and
+    with it any lookup or enrichment calls still in flight for the query.
+    """
+    task = asyncio.current_task()
+
+    @callback
+    def _cancel() -> None:
+        if task is not None:
+            task.cancel()
+
+    connection.subscriptions[msg["id"]] = _cancel
+    connection.send_result(msg["id"])
+
+    def _send_event(payload: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], payload))
+
+    return _send_event
+
+
 async def _handle_search(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
     service_type: str,
-    normalize_fn: Any,
 ) -> None:
     """Generic search handler for all arr services.
 
     Validates query, checks service configuration, calls arr lookup,
-    normalizes results, and sends response.
+    normalizes and enriches results.
+
+    Without "stream", replies once with the final results. With "stream",
+    the command is a cancellable subscription: the normalized lookup
+    results (with library index hits applied) are sent as one {"results"}
+    event, then a {"patch": {"index", ...fields}} event per fallback fetch
+    as it finishes, then {"done": true}. A failed lookup sends an
+    {"error", "message"} event before {"done": true}.
     """
     query = msg["query"].strip()
     if not query:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "invalid_query",
-                "message": "Search query cannot be empty",
-                "results": [],
-            },
+        _send_search_error(
+            connection, msg, "invalid_query", "Search query cannot be empty"
         )
         return
 
     coordinator = _get_coordinator(hass)
     if coordinator is None:
-        connection.send_error(
-            msg["id"], "not_found", "Requestarr not configured"
-        )
+        connection.send_error(msg["id"], "not_found", "Requestarr not configured")
         return
 
     client = coordinator.get_client(service_type)
     if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "service_not_configured",
-                "message": (
-                    f"{service_type.title()} is not configured in Requestarr"
-                ),
-                "results": [],
-            },
+        _send_search_error(
+            connection,
+            msg,
+            "service_not_configured",
+            f"{service_type.title()} is not configured in Requestarr",
         )
         return
 
-    config_data = _get_config_data(hass)
+    defaults = _get_service_defaults(hass, service_type)
+
+    if not msg.get("stream"):
+        try:
+            results = await _async_search_service(
+                coordinator, client, service_type, query, defaults
+            )
+        except (CannotConnectError, InvalidAuthError, ServerError) as err:
+            _LOGGER.warning("Search failed for %s: %s", service_type, err)
+            _send_search_error(
+                connection,
+                msg,
+                "service_unavailable",
+                f"{service_type.title()} is unavailable: {err}",
+            )
+            return
+        connection.send_result(msg["id"], {"results": results})
+        return
 
+    send_event = _open_search_subscription(connection, msg)
     try:
         raw_results = await client.async_search(query)
     except (CannotConnectError, InvalidAuthError, ServerError) as err:
-        _LOGGER.warning(
-            "Search failed for %s: %s", service_type, err
-        )
-        connection.send_result(
-            msg["id"],
+        _LOGGER.warning("Search failed for %s: %s", service_type, err)
+        send_event(
             {
                 "error": "service_unavailable",
-                "message": (
-                    f"{service_type.title()} is unavailable: {err}"
-                ),
-                "results": [],
-            },
+                "message": f"{service_type.title()} is unavailable: {err}",
+            }
         )
+        send_event({"done": True})
         return
 
     results = [
-        normalize_fn(item, config_data)
+        _SEARCH_NORMALIZERS[service_type](item, defaults)
         for item in raw_results[:MAX_SEARCH_RESULTS]
     ]
-    connection.send_result(msg["id"], {"results": results})
+    pending = []
+    enrich = _SEARCH_ENRICHERS.get(service_type)
+    if enrich is not None:
+        pending = enrich(
+            coordinator,
+            client,
+            results,
+            lambda index, fields: send_event({"patch": {"index": index, **fields}}),
+        )
+    send_event({"results": results})
+    await _gather_limited(pending, MAX_ENRICH_CONCURRENCY)
+    send_event({"done": True})
+
+
+# ---------------------------------------------------------------------------
+# Request submission
+# ---------------------------------------------------------------------------
+
+# Fields of each request kind, shared by the single and batch commands
+_MOVIE_REQUEST_FIELDS = {
+    vol.Required("tmdb_id"): int,
+    vol.Required("title"): str,
+    vol.Required("title_slug"): str,
+}
+_SERIES_REQUEST_FIELDS = {
+    vol.Required("tvdb_id"): int,
+    vol.Required("title"): str,
+    vol.Required("title_slug"): str,
+    vol.Required("seasons"): list,
+    vol.Optional("arr_id"): int,
+}
+_ARTIST_REQUEST_FIELDS = {
+    vol.Required("foreign_artist_id"): str,   # MusicBrainz UUID string
+    vol.Required("title"): str,               # artist name (for logging)
+}
+_ALBUM_REQUEST_FIELDS = {
+    vol.Required("foreign_artist_id"): str,
+    vol.Required("foreign_album_id"): str,
+    vol.Required("title"): str,
+    vol.Optional("album_arr_id"): int,
+}
+
+
+async def _async_add_movie(
+    client: ArrClient, config_data: Mapping[str, Any], item: dict[str, Any]
+) -> None:
+    await client.async_request_movie(
+        tmdb_id=item["tmdb_id"],
+        title=item["title"],
+        title_slug=item["title_slug"],
+        quality_profile_id=config_data.get(CONF_RADARR_QUALITY_PROFILE_ID),
+        root_folder_path=config_data.get(CONF_RADARR_ROOT_FOLDER, ""),
+    )
+
+
+async def _async_add_series(
+    client: ArrClient, config_data: Mapping[str, Any], item: dict[str, Any]
+) -> dict[str, Any] | None:
+    if arr_id := item.get("arr_id"):
+        # Series already in Sonarr — monitor requested seasons and trigger search
+        season_numbers = [
+            s.get("seasonNumber", 0)
+            for s in item["seasons"]
+            if s.get("monitored", False)
+        ]
+        searched = await client.async_monitor_seasons(arr_id, season_numbers)
+        return {
+            "seasons": [
+                {"season_number": number, "searched": ok}
+                for number, ok in searched.items()
+            ]
+        }
+    await client.async_request_series(
+        tvdb_id=item["tvdb_id"],
+        title=item["title"],
+        title_slug=item["title_slug"],
+        quality_profile_id=config_data.get(CONF_SONARR_QUALITY_PROFILE_ID),
+        root_folder_path=config_data.get(CONF_SONARR_ROOT_FOLDER, ""),
+        seasons=item["seasons"],
+    )
+
+
+async def _async_add_artist(
+    client: ArrClient, config_data: Mapping[str, Any], item: dict[str, Any]
+) -> None:
+    await client.async_request_artist(
+        foreign_artist_id=item["foreign_artist_id"],
+        artist_name=item["title"],
+        quality_profile_id=config_data.get(CONF_LIDARR_QUALITY_PROFILE_ID),
+        metadata_profile_id=config_data.get(CONF_LIDARR_METADATA_PROFILE_ID),
+        root_folder_path=config_data.get(CONF_LIDARR_ROOT_FOLDER, ""),
+    )
+
+
+async def _async_add_album(
+    client: ArrClient, config_data: Mapping[str, Any], item: dict[str, Any]
+) -> None:
+    if album_arr_id := item.get("album_arr_id"):
+        await client.async_monitor_album(album_arr_id)
+        return
+    await client.async_request_album(
+        foreign_artist_id=item["foreign_artist_id"],
+        foreign_album_id=item["foreign_album_id"],
+        artist_name=item["title"],
+        quality_profile_id=config_data.get(CONF_LIDARR_QUALITY_PROFILE_ID),
+        metadata_profile_id=config_data.get(CONF_LIDARR_METADATA_PROFILE_ID),
+        root_folder_path=config_data.get(CONF_LIDARR_ROOT_FOLDER, ""),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _RequestKind:
+    """How one kind of request is validated, submitted and reported."""
+
+    service_type: str
+    fields: dict[Any, Any]
+    # Returns extra fields for the success result, if any
+    submit: Callable[
+        [ArrClient, Mapping[str, Any], dict[str, Any]],
+        Coroutine[Any, Any, dict[str, Any] | None],
+    ]
+    id_field: str  # external ID whose cached lookups go stale
+    noun: str  # what "already exists" refers to
+
+
+_REQUEST_KINDS: dict[str, _RequestKind] = {
+    "movie": _RequestKind(
+        SERVICE_RADARR, _MOVIE_REQUEST_FIELDS, _async_add_movie, "tmdb_id", "movie"
+    ),
+    "series": _RequestKind(
+        SERVICE_SONARR, _SERIES_REQUEST_FIELDS, _async_add_series, "tvdb_id", "series"
+    ),
+    "artist": _RequestKind(
+        SERVICE_LIDARR,
+        _ARTIST_REQUEST_FIELDS,
+        _async_add_artist,
+        "foreign_artist_id",
+        "artist",
+    ),
+    "album": _RequestKind(
+        SERVICE_LIDARR,
+        _ALBUM_REQUEST_FIELDS,
+        _async_add_album,
+        "foreign_artist_id",
+        "artist",
+    ),
+}
+
+
+async def _async_submit_request(
+    hass: HomeAssistant, kind: str, item: dict[str, Any]
+) -> dict[str, Any]:
+    """Submit one request to its arr service and return the result payload.
+
+    Returns {"success": True}, or {"success": False, "error_code",
+    "message"} with error_code one of not_configured,
+    service_not_configured, already_exists or service_unavailable.
+    Monitoring seasons of a library series also reports a "seasons" list
+    of {"season_number", "searched"}.
+    """
+    spec = _REQUEST_KINDS[kind]
+    coordinator = _get_coordinator(hass)
+    if coordinator is None:
+        return {
+            "success": False,
+            "error_code": "not_configured",
+            "message": "Requestarr not configured",
+        }
+
+    service_name = spec.service_type.title()
+    client = coordinator.get_client(spec.service_type)
+    if client is None:
+        return {
+            "success": False,
+            "error_code": "service_not_configured",
+            "message": f"{service_name} is not configured",
+        }
+
+    try:
+        extra = await spec.submit(client, _get_config_data(hass), item)
+    except ServerError as err:
+        err_str = str(err)
+        # HTTP 400 on the add endpoint means the item is already in the library
+        if "400" in err_str and "already been added" in err_str.lower():
+            return {
+                "success": False,
+                "error_code": "already_exists",
+                "message": f"This {spec.noun} is already in {service_name}",
+            }
+        _LOGGER.warning("%s request failed: %s", kind.title(), err)
+        return {
+            "success": False,
+            "error_code": "service_unavailable",
+            "message": err_str,
+        }
+    except (CannotConnectError, InvalidAuthError) as err:
+        _LOGGER.warning("%s request failed: %s", kind.title(), err)
+        return {
+            "success": False,
+            "error_code": "service_unavailable",
+            "message": str(err),
+        }
+
+    client.invalidate_search(item[spec.id_field])
+    if spec.service_type == SERVICE_LIDARR:
+        client.invalidate_albums(item["foreign_artist_id"])
+    return {"success": True, **(extra or {})}
+
+
+def _validate_batch_item(value: Any) -> dict[str, Any]:
+    """Validate one request_batch item against the fields of its kind."""
+    value = vol.Schema(
+        {vol.Required("kind"): vol.In(_REQUEST_KINDS)}, extra=vol.ALLOW_EXTRA
+    )(value)
+    return vol.Schema(
+        {vol.Required("kind"): str, **_REQUEST_KINDS[value["kind"]].fields}
+    )(value)
 
 
 # ---------------------------------------------------------------------------
@@ -307,6 +780,7 @@ async def websocket_get_data(
     {
         vol.Required("type"): WS_TYPE_SEARCH_MOVIES,
         vol.Required("query"): str,
+        vol.Optional("stream", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -317,76 +791,20 @@ async def websocket_search_movies(
 ) -> None:
     """Handle movie search via Radarr lookup endpoint.
 
-    For movies already in the library, fetches accurate hasFile status
-    from /movie/{id} so that monitored-but-not-downloaded movies show
-    "Requested" instead of "In Library".
+    For movies already in the library, fills in accurate hasFile status
+    from the coordinator's library index (or /movie/{id} on an index miss)
+    so that monitored-but-not-downloaded movies show "Requested" instead
+    of "In Library". Pass stream=True to get lookup results first and
+    hasFile corrections as patches.
     """
-    query = msg["query"].strip()
-    if not query:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "invalid_query",
-                "message": "Search query cannot be empty",
-                "results": [],
-            },
-        )
-        return
-
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_error(msg["id"], "not_found", "Requestarr not configured")
-        return
-
-    client = coordinator.get_client(SERVICE_RADARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "service_not_configured",
-                "message": "Radarr is not configured in Requestarr",
-                "results": [],
-            },
-        )
-        return
-
-    config_data = _get_config_data(hass)
-
-    try:
-        raw_results = await client.async_search(query)
-    except (CannotConnectError, InvalidAuthError, ServerError) as err:
-        _LOGGER.warning("Search failed for radarr: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "service_unavailable",
-                "message": f"Radarr is unavailable: {err}",
-                "results": [],
-            },
-        )
-        return
-
-    results = []
-    for item in raw_results[:MAX_SEARCH_RESULTS]:
-        normalized = _normalize_movie_result(item, config_data)
-        # Enrich in-library results with accurate hasFile from /movie/{id}.
-        # The lookup endpoint does not populate hasFile.
-        if normalized["arr_id"] is not None:
-            try:
-                movie_data = await client.async_get_movie(normalized["arr_id"])
-                if movie_data:
-                    normalized["has_file"] = movie_data.get("hasFile", False)
-            except (CannotConnectError, InvalidAuthError, ServerError):
-                pass  # keep default has_file=False as fallback
-        results.append(normalized)
-
-    connection.send_result(msg["id"], {"results": results})
+    await _handle_search(hass, connection, msg, SERVICE_RADARR)
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): WS_TYPE_SEARCH_TV,
         vol.Required("query"): str,
+        vol.Optional("stream", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -397,79 +815,20 @@ async def websocket_search_tv(
 ) -> None:
     """Handle TV series search via Sonarr lookup endpoint.
 
-    For series already in the library, fetches accurate season statistics
-    from /series/{id} so that episodeFileCount is reliable for per-season
-    in-library display. The lookup endpoint does not populate episodeFileCount.
+    For series already in the library, fills in accurate season statistics
+    from the coordinator's library index (or /series/{id} on an index miss)
+    so that episodeFileCount is reliable for per-season in-library display.
+    The lookup endpoint does not populate episodeFileCount. Pass
+    stream=True to get lookup results first and season patches later.
     """
-    query = msg["query"].strip()
-    if not query:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "invalid_query",
-                "message": "Search query cannot be empty",
-                "results": [],
-            },
-        )
-        return
-
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_error(msg["id"], "not_found", "Requestarr not configured")
-        return
-
-    client = coordinator.get_client(SERVICE_SONARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "service_not_configured",
-                "message": "Sonarr is not configured in Requestarr",
-                "results": [],
-            },
-        )
-        return
-
-    config_data = _get_config_data(hass)
-
-    try:
-        raw_results = await client.async_search(query)
-    except (CannotConnectError, InvalidAuthError, ServerError) as err:
-        _LOGGER.warning("Search failed for sonarr: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "error": "service_unavailable",
-                "message": f"Sonarr is unavailable: {err}",
-                "results": [],
-            },
-        )
-        return
-
-    results = []
-    for item in raw_results[:MAX_SEARCH_RESULTS]:
-        normalized = _normalize_tv_result(item, config_data)
-        # Enrich in-library results with accurate season stats from /series/{id}.
-        # The lookup endpoint does not populate statistics.episodeFileCount, so
-        # per-season library status would be unreliable without this extra call.
-        if normalized["arr_id"] is not None:
-            try:
-                accurate_seasons = await client.async_get_series_seasons(
-                    normalized["arr_id"]
-                )
-                if accurate_seasons:
-                    normalized["seasons"] = accurate_seasons
-            except (CannotConnectError, InvalidAuthError, ServerError):
-                pass  # keep lookup seasons as fallback
-        results.append(normalized)
-
-    connection.send_result(msg["id"], {"results": results})
+    await _handle_search(hass, connection, msg, SERVICE_SONARR)
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): WS_TYPE_SEARCH_MUSIC,
         vol.Required("query"): str,
+        vol.Optional("stream", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -478,107 +837,90 @@ async def websocket_search_music(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle music artist search via Lidarr lookup endpoint."""
-    await _handle_search(
-        hass, connection, msg, SERVICE_LIDARR, _normalize_music_result
-    )
+    """Handle music artist search via Lidarr lookup endpoint.
+
+    Pass stream=True to run it as a cancellable subscription.
+    """
+    await _handle_search(hass, connection, msg, SERVICE_LIDARR)
 
 
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): WS_TYPE_REQUEST_MOVIE,
-        vol.Required("tmdb_id"): int,
-        vol.Required("title"): str,
-        vol.Required("title_slug"): str,
+        vol.Required("type"): WS_TYPE_SEARCH_ALL,
+        vol.Required("query"): str,
     }
 )
 @websocket_api.async_response
-async def websocket_request_movie(
+async def websocket_search_all(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle movie request via Radarr POST."""
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "not_configured",
-                "message": "Requestarr not configured",
-            },
+    """Handle search_all — search every configured service at once.
+
+    Subscription: after the result, one event per service is sent as soon
+    as that service's lookup and enrichment finish, as
+    {"service", "results"} or {"service", "error", "message"}, so the
+    fastest service shows first. A final {"done": true} event follows.
+    Unsubscribing cancels the lookups still in flight.
+    """
+    query = msg["query"].strip()
+    if not query:
+        connection.send_error(
+            msg["id"], "invalid_query", "Search query cannot be empty"
         )
         return
 
-    client = coordinator.get_client(SERVICE_RADARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_not_configured",
-                "message": "Radarr is not configured",
-            },
-        )
+    coordinator = _get_coordinator(hass)
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Requestarr not configured")
         return
 
-    config_data = _get_config_data(hass)
-    quality_profile_id = config_data.get(CONF_RADARR_QUALITY_PROFILE_ID)
-    root_folder = config_data.get(CONF_RADARR_ROOT_FOLDER, "")
+    send_event = _open_search_subscription(connection, msg)
 
-    try:
-        await client.async_request_movie(
-            tmdb_id=msg["tmdb_id"],
-            title=msg["title"],
-            title_slug=msg["title_slug"],
-            quality_profile_id=quality_profile_id,
-            root_folder_path=root_folder,
-        )
-        connection.send_result(msg["id"], {"success": True})
-    except ServerError as err:
-        err_str = str(err)
-        # Radarr 400 on the add endpoint means the movie is already in the library
-        if "400" in err_str and "already been added" in err_str.lower():
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "already_exists",
-                    "message": "This movie is already in Radarr",
-                },
+    async def _search(service_type: str) -> None:
+        client = coordinator.get_client(service_type)
+        try:
+            results = await _async_search_service(
+                coordinator,
+                client,
+                service_type,
+                query,
+                _get_service_defaults(hass, service_type),
             )
-        else:
-            _LOGGER.warning("Movie request failed: %s", err)
-            connection.send_result(
-                msg["id"],
+        except (CannotConnectError, InvalidAuthError, ServerError) as err:
+            _LOGGER.warning("Search failed for %s: %s", service_type, err)
+            send_event(
                 {
-                    "success": False,
-                    "error_code": "service_unavailable",
-                    "message": str(err),
-                },
+                    "service": service_type,
+                    "error": "service_unavailable",
+                    "message": f"{service_type.title()} is unavailable: {err}",
+                }
             )
-    except (CannotConnectError, InvalidAuthError) as err:
-        _LOGGER.warning("Movie request failed: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_unavailable",
-                "message": str(err),
-            },
-        )
+            return
+        send_event({"service": service_type, "results": results})
+
+    await asyncio.gather(
+        *(_search(service_type) for service_type in coordinator.configured_services)
+    )
+    send_event({"done": True})
 
 
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): WS_TYPE_REQUEST_TV,
-        vol.Required("tvdb_id"): int,
-        vol.Required("title"): str,
-        vol.Required("title_slug"): str,
-        vol.Required("seasons"): list,
-        vol.Optional("arr_id"): int,
-    }
+    {vol.Required("type"): WS_TYPE_REQUEST_MOVIE, **_MOVIE_REQUEST_FIELDS}
+)
+@websocket_api.async_response
+async def websocket_request_movie(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle movie request via Radarr POST."""
+    connection.send_result(msg["id"], await _async_submit_request(hass, "movie", msg))
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_TYPE_REQUEST_TV, **_SERIES_REQUEST_FIELDS}
 )
 @websocket_api.async_response
 async def websocket_request_series(
@@ -587,173 +929,60 @@ async def websocket_request_series(
     msg: dict[str, Any],
 ) -> None:
     """Handle TV series request via Sonarr POST."""
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "not_configured",
-                "message": "Requestarr not configured",
-            },
-        )
-        return
+    connection.send_result(msg["id"], await _async_submit_request(hass, "series", msg))
 
-    client = coordinator.get_client(SERVICE_SONARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_not_configured",
-                "message": "Sonarr is not configured",
-            },
-        )
-        return
 
-    config_data = _get_config_data(hass)
-    quality_profile_id = config_data.get(CONF_SONARR_QUALITY_PROFILE_ID)
-    root_folder = config_data.get(CONF_SONARR_ROOT_FOLDER, "")
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_TYPE_REQUEST_ARTIST, **_ARTIST_REQUEST_FIELDS}
+)
+@websocket_api.async_response
+async def websocket_request_artist(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle music artist request via Lidarr POST."""
+    connection.send_result(msg["id"], await _async_submit_request(hass, "artist", msg))
 
-    arr_id = msg.get("arr_id")
 
-    try:
-        if arr_id:
-            # Series already in Sonarr — monitor requested seasons and trigger search
-            season_numbers = [
-                s.get("seasonNumber", 0)
-                for s in msg["seasons"]
-                if s.get("monitored", False)
-            ]
-            await client.async_monitor_seasons(arr_id, season_numbers)
-        else:
-            await client.async_request_series(
-                tvdb_id=msg["tvdb_id"],
-                title=msg["title"],
-                title_slug=msg["title_slug"],
-                quality_profile_id=quality_profile_id,
-                root_folder_path=root_folder,
-                seasons=msg["seasons"],
-            )
-        connection.send_result(msg["id"], {"success": True})
-    except ServerError as err:
-        err_str = str(err)
-        # Sonarr 400 on the add endpoint means the series is already in the library
-        if "400" in err_str and "already been added" in err_str.lower():
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "already_exists",
-                    "message": "This series is already in Sonarr",
-                },
-            )
-        else:
-            _LOGGER.warning("Series request failed: %s", err)
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "service_unavailable",
-                    "message": str(err),
-                },
-            )
-    except (CannotConnectError, InvalidAuthError) as err:
-        _LOGGER.warning("Series request failed: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_unavailable",
-                "message": str(err),
-            },
-        )
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_TYPE_REQUEST_ALBUM, **_ALBUM_REQUEST_FIELDS}
+)
+@websocket_api.async_response
+async def websocket_request_album(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle single album request via Lidarr POST."""
+    connection.send_result(msg["id"], await _async_submit_request(hass, "album", msg))
 
 
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): WS_TYPE_REQUEST_ARTIST,
-        vol.Required("foreign_artist_id"): str,   # MusicBrainz UUID string
-        vol.Required("title"): str,               # artist name (for logging)
+        vol.Required("type"): WS_TYPE_REQUEST_BATCH,
+        vol.Required("items"): vol.All(
+            [_validate_batch_item], vol.Length(min=1, max=MAX_BATCH_REQUESTS)
+        ),
     }
 )
 @websocket_api.async_response
-async def websocket_request_artist(
+async def websocket_request_batch(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle music artist request via Lidarr POST."""
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "not_configured",
-                "message": "Requestarr not configured",
-            },
-        )
-        return
+    """Handle request_batch — submit a mixed list of requests at once.
 
-    client = coordinator.get_client(SERVICE_LIDARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_not_configured",
-                "message": "Lidarr is not configured",
-            },
-        )
-        return
-
-    config_data = _get_config_data(hass)
-    quality_profile_id = config_data.get(CONF_LIDARR_QUALITY_PROFILE_ID)
-    metadata_profile_id = config_data.get(CONF_LIDARR_METADATA_PROFILE_ID)
-    root_folder = config_data.get(CONF_LIDARR_ROOT_FOLDER, "")
-
-    try:
-        await client.async_request_artist(
-            foreign_artist_id=msg["foreign_artist_id"],
-            artist_name=msg["title"],
-            quality_profile_id=quality_profile_id,
-            metadata_profile_id=metadata_profile_id,
-            root_folder_path=root_folder,
-        )
-        connection.send_result(msg["id"], {"success": True})
-    except ServerError as err:
-        err_str = str(err)
-        # Lidarr 400 on the add endpoint means the artist is already in the library
-        if "400" in err_str and "already been added" in err_str.lower():
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "already_exists",
-                    "message": "This artist is already in Lidarr",
-                },
-            )
-        else:
-            _LOGGER.warning("Artist request failed: %s", err)
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "service_unavailable",
-                    "message": str(err),
-                },
-            )
-    except (CannotConnectError, InvalidAuthError) as err:
-        _LOGGER.warning("Artist request failed: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_unavailable",
-                "message": str(err),
-            },
-        )
+    Each item carries a "kind" (movie, series, artist or album) plus the
+    fields of the matching single request command. Items are submitted
+    concurrently, bounded by each service's request limiter, and the
+    result holds one single-request result per item, in item order.
+    """
+    results = await asyncio.gather(
+        *(_async_submit_request(hass, item["kind"], item) for item in msg["items"])
+    )
+    connection.send_result(msg["id"], {"results": results})
 
 
 @websocket_api.websocket_command(
@@ -822,226 +1051,116 @@ async def websocket_get_artist_albums(
         connection.send_result(msg["id"], {"albums": [], "error": str(err)})
 
 
+# ---------------------------------------------------------------------------
+# Queue handler
+# ---------------------------------------------------------------------------
+
+
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): WS_TYPE_REQUEST_ALBUM,
-        vol.Required("foreign_artist_id"): str,
-        vol.Required("foreign_album_id"): str,
-        vol.Required("title"): str,
-        vol.Optional("album_arr_id"): int,
+        vol.Required("type"): WS_TYPE_GET_QUEUE,
+        vol.Optional("service"): str,
     }
 )
 @websocket_api.async_response
-async def websocket_request_album(
+async def websocket_get_queue(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle single album request via Lidarr POST."""
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "not_configured",
-                "message": "Requestarr not configured",
-            },
-        )
-        return
-
-    client = coordinator.get_client(SERVICE_LIDARR)
-    if client is None:
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_not_configured",
-                "message": "Lidarr is not configured",
-            },
-        )
+    """Handle get_queue — serve the shared download-queue snapshot."""
+    queue_coordinator = _get_queue_coordinator(hass)
+    if queue_coordinator is None:
+        connection.send_result(msg["id"], {"items": []})
         return
 
-    config_data = _get_config_data(hass)
-    quality_profile_id = config_data.get(CONF_LIDARR_QUALITY_PROFILE_ID)
-    metadata_profile_id = config_data.get(CONF_LIDARR_METADATA_PROFILE_ID)
-    root_folder = config_data.get(CONF_LIDARR_ROOT_FOLDER, "")
-
-    album_arr_id = msg.get("album_arr_id")
+    items = await queue_coordinator.async_get_items()
+    service_filter = msg.get("service")
+    if service_filter:
+        items = [item for item in items if item["service"] == service_filter]
 
-    try:
-        if album_arr_id:
-            await client.async_monitor_album(album_arr_id)
-        else:
-            await client.async_request_album(
-                foreign_artist_id=msg["foreign_artist_id"],
-                foreign_album_id=msg["foreign_album_id"],
-                artist_name=msg["title"],
-                quality_profile_id=quality_profile_id,
-                metadata_profile_id=metadata_profile_id,
-                root_folder_path=root_folder,
-            )
-        connection.send_result(msg["id"], {"success": True})
-    except ServerError as err:
-        err_str = str(err)
-        if "400" in err_str and "already been added" in err_str.lower():
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "already_exists",
-                    "message": "This artist is already in Lidarr",
-                },
-            )
-        else:
-            _LOGGER.warning("Album request failed: %s", err)
-            connection.send_result(
-                msg["id"],
-                {
-                    "success": False,
-                    "error_code": "service_unavailable",
-                    "message": str(err),
-                },
-            )
-    except (CannotConnectError, InvalidAuthError) as err:
-        _LOGGER.warning("Album request failed: %s", err)
-        connection.send_result(
-            msg["id"],
-            {
-                "success": False,
-                "error_code": "service_unavailable",
-                "message": str(err),
-            },
-        )
+    connection.send_result(msg["id"], {"items": items})
 
 
-# ---------------------------------------------------------------------------
-# Queue handler
-# ---------------------------------------------------------------------------
+def _queue_key(item: dict[str, Any]) -> tuple[str, Any]:
+    """Return the identity of a normalized queue item (ids are per service)."""
+    return (item["service"], item["queue_id"])
 
 
-def _format_timeleft(raw: str) -> str:
-    """Format .NET TimeSpan (e.g. '6.10:46:09.123' or '01:23:45') into human-friendly ETA."""
-    if not raw:
-        return ""
-    # Parse optional days prefix: "D.HH:MM:SS.fff" or "HH:MM:SS.fff"
-    days = 0
-    time_part = raw
-    if "." in raw.split(":")[0]:
-        day_str, time_part = raw.split(".", 1)
-        try:
-            days = int(day_str)
-        except ValueError:
-            return raw
-    # Strip fractional seconds
-    base = time_part.split(".")[0] if "." in time_part else time_part
-    parts = base.split(":")
-    if len(parts) != 3:
-        return raw
-    try:
-        h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
-    except ValueError:
-        return raw
-    h += days * 24
-    if h > 0:
-        return f"{h}h {m}m"
-    if m > 0:
-        return f"{m}m {s}s"
-    return f"{s}s"
-
-
-def _normalize_queue_item(item: dict[str, Any], service_type: str) -> dict[str, Any]:
-    """Normalize a queue record from any arr service into a standard format."""
-    size = item.get("size", 0)
-    sizeleft = item.get("sizeleft", 0)
-    progress = round((1 - sizeleft / size) * 100, 1) if size > 0 else 0.0
-
-    season_number = None
-    album_id = None
-
-    # Extract media_id and human-readable title from nested objects.
-    # The top-level "title" is the release/torrent name, not the media title.
-    if service_type == SERVICE_RADARR:
-        movie = item.get("movie") or {}
-        media_id = movie.get("id") or item.get("movieId")
-        title = movie.get("title", "") or item.get("title", "")
-    elif service_type == SERVICE_SONARR:
-        series = item.get("series") or {}
-        episode = item.get("episode") or {}
-        media_id = item.get("seriesId") or series.get("id")
-        series_title = series.get("title", "")
-        sn = item.get("seasonNumber") or episode.get("seasonNumber")
-        season_number = sn
-        ep = episode.get("episodeNumber")
-        ep_title = episode.get("title", "")
-        # Build "Bluey — S03E12 — Cricket"
-        parts = [series_title]
-        if sn is not None and ep is not None:
-            parts.append(f"S{sn:02d}E{ep:02d}")
-        elif sn is not None:
-            parts.append(f"S{sn:02d}")
-        if ep_title:
-            parts.append(ep_title)
-        title = " \u2014 ".join(parts) if parts[0] else item.get("title", "")
-    else:
-        artist = item.get("artist") or {}
-        album = item.get("album") or {}
-        media_id = item.get("artistId") or artist.get("id")
-        album_id = album.get("id")
-        artist_name = artist.get("artistName", "")
-        album_title = album.get("title", "")
-        if artist_name and album_title:
-            title = f"{artist_name} \u2014 {album_title}"
-        else:
-            title = artist_name or album_title or item.get("title", "")
+def _diff_queue(
+    old: dict[tuple[str, Any], dict[str, Any]],
+    new: dict[tuple[str, Any], dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Compute the delta between two keyed queue snapshots.
 
-    return {
-        "title": title,
-        "service": service_type,
-        "media_id": media_id,
-        "season_number": season_number,
-        "album_id": album_id,
-        "progress": progress,
-        "timeleft": _format_timeleft(item.get("timeleft") or ""),
-        "status": item.get("status", ""),
-        "queue_id": item.get("id"),
-    }
+    Returns:
+        Dict with added (full items), removed (service + queue_id) and
+        updated (service + queue_id + only the changed fields, typically
+        progress/timeleft/status), or None if nothing changed.
+    """
+    added = [item for key, item in new.items() if key not in old]
+    removed = [
+        {"service": key[0], "queue_id": key[1]} for key in old if key not in new
+    ]
+    updated = []
+    for key, item in new.items():
+        previous = old.get(key)
+        if previous is None or previous == item:
+            continue
+        changes = {
+            field: value
+            for field, value in item.items()
+            if previous.get(field) != value
+        }
+        updated.append({"service": key[0], "queue_id": key[1], **changes})
+    if not (added or removed or updated):
+        return None
+    return {"added": added, "removed": removed, "updated": updated}
 
 
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): WS_TYPE_GET_QUEUE,
-        vol.Optional("service"): str,
+        vol.Required("type"): WS_TYPE_SUBSCRIBE_QUEUE,
     }
 )
 @websocket_api.async_response
-async def websocket_get_queue(
+async def websocket_subscribe_queue(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle get_queue — fetch download queue from arr services."""
-    coordinator = _get_coordinator(hass)
-    if coordinator is None:
-        connection.send_result(msg["id"], {"items": []})
-        return
+    """Handle subscribe_queue — push the queue once, then only changes.
 
-    service_filter = msg.get("service")
-    services = [service_filter] if service_filter else ARR_SERVICES
-
-    all_items: list[dict[str, Any]] = []
-    for svc in services:
-        client = coordinator.get_client(svc)
-        if client is None:
-            continue
-        try:
-            records = await client.async_get_queue()
-            for record in records:
-                all_items.append(_normalize_queue_item(record, svc))
-        except (CannotConnectError, InvalidAuthError, ServerError):
-            pass  # skip unavailable services
+    The first event carries the full normalized queue as {"items": [...]};
+    later events carry {"added", "removed", "updated"} deltas. While any
+    subscription is open the shared queue snapshot refreshes on its own
+    schedule.
+    """
+    queue_coordinator = _get_queue_coordinator(hass)
+    if queue_coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Requestarr not configured")
+        return
 
-    connection.send_result(msg["id"], {"items": all_items})
+    items = await queue_coordinator.async_get_items()
+    last_sent = {_queue_key(item): item for item in items}
+
+    @callback
+    def _forward_changes() -> None:
+        nonlocal last_sent
+        current = {
+            _queue_key(item): item
+            for item in (queue_coordinator.data or {}).get("items", [])
+        }
+        delta = _diff_queue(last_sent, current)
+        last_sent = current
+        if delta is not None:
+            connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = queue_coordinator.async_add_listener(
+        _forward_changes
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {"items": items}))
 
 
 @websocket_api.websocket_command(
@@ -1077,6 +1196,7 @@ async def websocket_delete_queue_item(
             remove_from_client=msg.get("remove_from_client", True),
             blocklist=msg.get("blocklist", False),
         )
+        _get_queue_coordinator(hass).async_remove_item(service, msg["queue_id"])
         connection.send_result(msg["id"], {"success": True})
     except (CannotConnectError, InvalidAuthError, ServerError) as err:
         connection.send_error(msg["id"], "delete_failed", str(err))
@@ -1094,11 +1214,14 @@ def async_setup_websocket(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_search_movies)
     websocket_api.async_register_command(hass, websocket_search_tv)
     websocket_api.async_register_command(hass, websocket_search_music)
+    websocket_api.async_register_command(hass, websocket_search_all)
     websocket_api.async_register_command(hass, websocket_request_movie)
     websocket_api.async_register_command(hass, websocket_request_series)
     websocket_api.async_register_command(hass, websocket_request_artist)
     websocket_api.async_register_command(hass, websocket_get_series_seasons)
     websocket_api.async_register_command(hass, websocket_get_artist_albums)
     websocket_api.async_register_command(hass, websocket_request_album)
+    websocket_api.async_register_command(hass, websocket_request_batch)
     websocket_api.async_register_command(hass, websocket_delete_queue_item)
     websocket_api.async_register_command(hass, websocket_get_queue)
+    websocket_api.async_register_command(hass, websocket_subscribe_queue)
@@ -0,0 +1,396 @@
+"""Tests for the Requestarr arr API client."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from custom_components.requestarr.api import (
+    ArrClient,
+    CannotConnectError,
+    CircuitOpenError,
+    ServerError,
+    _JsonArrayScanner,
+    _json_loads,
+    _library_index_entry,
+)
+from custom_components.requestarr.resilience import CircuitBreaker, RetryPolicy
+
+
+def _feed_in_chunks(scanner: _JsonArrayScanner, raw: bytes, size: int) -> None:
+    for start in range(0, len(raw), size):
+        scanner.feed(raw[start : start + size])
+
+
+def test_array_scanner_counts_top_level_objects() -> None:
+    """Nested objects and arrays are not counted — only top-level elements."""
+    raw = json.dumps(
+        [
+            {"id": 1, "seasons": [{"seasonNumber": 1}, {"seasonNumber": 2}]},
+            {"id": 2, "images": [{"coverType": "poster"}]},
+            {"id": 3},
+        ]
+    ).encode()
+    scanner = _JsonArrayScanner()
+    scanner.feed(raw)
+    assert scanner.count == 3
+
+
+def test_array_scanner_ignores_brackets_inside_strings() -> None:
+    """Braces, brackets and escaped quotes inside strings do not affect depth."""
+    raw = json.dumps(
+        [{"title": 'Weird "{[title]}" \\ name'}, {"title": "}]"}]
+    ).encode()
+    scanner = _JsonArrayScanner()
+    scanner.feed(raw)
+    assert scanner.count == 2
+
+
+def test_array_scanner_handles_any_chunk_boundary() -> None:
+    """Splitting the body at every possible size gives the same count."""
+    raw = json.dumps(
+        [{"title": 'a\\"b{', "tags": [1, {"x": "]"}]} for _ in range(25)]
+    ).encode()
+    for size in range(1, 17):
+        scanner = _JsonArrayScanner()
+        _feed_in_chunks(scanner, raw, size)
+        assert scanner.count == 25, f"chunk size {size}"
+
+
+def test_array_scanner_empty_array() -> None:
+    """An empty library counts as zero."""
+    scanner = _JsonArrayScanner()
+    scanner.feed(b"[]")
+    assert scanner.count == 0
+
+
+def test_array_scanner_captures_each_element() -> None:
+    """With capture enabled, each element's raw bytes decode on their own."""
+    items = [
+        {"id": 1, "title": "A {tricky} \"one\"", "seasons": [{"n": 1}]},
+        {"id": 2, "title": "B"},
+    ]
+    raw = json.dumps(items).encode()
+    for size in (1, 3, 7, len(raw)):
+        scanner = _JsonArrayScanner(capture=True)
+        captured = []
+        for start in range(0, len(raw), size):
+            scanner.feed(raw[start : start + size])
+            captured.extend(scanner.elements)
+            scanner.elements.clear()
+        assert [json.loads(el) for el in captured] == items, f"chunk size {size}"
+
+
+def test_library_index_entry_sonarr_keeps_season_stats() -> None:
+    """Sonarr entries keep per-season file stats in the /series/{id} shape."""
+    item = {
+        "id": 10,
+        "tvdbId": 1234,
+        "monitored": True,
+        "title": "Bluey",
+        "overview": "Dropped from the index",
+        "statistics": {"episodeFileCount": 3},
+        "seasons": [
+            {
+                "seasonNumber": 1,
+                "monitored": True,
+                "statistics": {
+                    "episodeFileCount": 3,
+                    "episodeCount": 3,
+                    "totalEpisodeCount": 52,
+                    "sizeOnDisk": 123456,
+                },
+            }
+        ],
+    }
+    entry = _library_index_entry(item, "sonarr")
+    assert entry == {
+        "id": 10,
+        "monitored": True,
+        "has_file": True,
+        "seasons": [
+            {
+                "seasonNumber": 1,
+                "monitored": True,
+                "statistics": {
+                    "episodeFileCount": 3,
+                    "episodeCount": 3,
+                    "totalEpisodeCount": 52,
+                },
+            }
+        ],
+    }
+
+
+def test_json_loads_decodes_bytes() -> None:
+    """Bodies are decoded straight from bytes, including non-ASCII titles."""
+    body = json.dumps([{"title": "Amélie"}]).encode()
+    assert _json_loads(body) == [{"title": "Amélie"}]
+
+
+async def test_search_cache_folds_case_and_whitespace() -> None:
+    """Repeat lookups with the same normalized term are served from cache."""
+    client = ArrClient("http://radarr:7878", "key", "radarr", session=None)
+    raw = [{"id": 0, "tmdbId": 27205, "title": "Inception"}]
+    with patch.object(
+        ArrClient, "_request", new_callable=AsyncMock, return_value=raw
+    ) as mock_request:
+        assert await client.async_search("Inception") == raw
+        assert await client.async_search("  inception ") == raw
+        assert mock_request.await_count == 1
+
+        # A successful request for the title drops the cached lookup
+        client.invalidate_search(27205)
+        await client.async_search("inception")
+        assert mock_request.await_count == 2
+
+
+async def test_album_list_cache_shared_by_expand_and_request() -> None:
+    """The album lookup is fetched once for an expand and a following request."""
+    client = ArrClient("http://lidarr:8686", "key", "lidarr", session=None)
+    artist_id = "a74b1b7f-71a5-4011-9441-d0b5e4122711"
+    lookup = [
+        {"id": 0, "title": "OK Computer", "foreignAlbumId": "album-1"},
+        {"id": 0, "title": "Kid A", "foreignAlbumId": "album-2"},
+    ]
+    with patch.object(
+        ArrClient, "_request", new_callable=AsyncMock, return_value=lookup
+    ) as mock_request:
+        albums = await client.async_get_artist_albums(artist_id)
+        assert [a["foreign_album_id"] for a in albums] == ["album-1", "album-2"]
+
+        await client.async_request_album(
+            artist_id, "album-2", "Radiohead", 1, 1, "/music"
+        )
+        assert mock_request.await_count == 2  # one lookup, one POST
+        post = mock_request.await_args_list[1]
+        assert post.args == ("POST", "/artist")
+        assert post.kwargs["json"]["albums"] == [
+            {"foreignAlbumId": "album-1", "monitored": False},
+            {"foreignAlbumId": "album-2", "monitored": True},
+        ]
+
+        # A successful request drops the artist's cached album lists
+        client.invalidate_albums(artist_id)
+        await client.async_get_artist_albums(artist_id)
+        assert mock_request.await_count == 3
+
+
+async def test_monitor_seasons_consolidates_searches() -> None:
+    """A fully monitored series gets one SeriesSearch, otherwise one per season."""
+    client = ArrClient("http://sonarr:8989", "key", "sonarr", session=None)
+    commands: list[dict] = []
+
+    def series(monitored: list[bool]) -> dict:
+        return {
+            "id": 5,
+            "seasons": [
+                {"seasonNumber": number, "monitored": flag}
+                for number, flag in enumerate(monitored)
+            ],
+        }
+
+    async def mock_request(self, method, endpoint, **kwargs):
+        if method == "GET":
+            return current
+        if endpoint == "/command":
+            commands.append(kwargs["json"])
+            if kwargs["json"].get("seasonNumber") == 3:
+                raise ServerError("HTTP 500: Internal Server Error")
+        return {}
+
+    with patch.object(ArrClient, "_request", new=mock_request):
+        # Specials stay unmonitored; seasons 1-2 complete the series
+        current = series([False, False, False, True])
+        assert await client.async_monitor_seasons(5, [1, 2]) == {1: True, 2: True}
+        assert commands == [{"name": "SeriesSearch", "seriesId": 5}]
+
+        commands.clear()
+        current = series([False, False, False, False, False])
+        result = await client.async_monitor_seasons(5, [1, 3])
+        assert result == {1: True, 3: False}
+        assert sorted(c["seasonNumber"] for c in commands) == [1, 3]
+        assert all(c["name"] == "SeasonSearch" for c in commands)
+
+
+async def test_identical_gets_share_one_request() -> None:
+    """Overlapping identical GETs go out once; other calls are not coalesced."""
+    client = ArrClient("http://sonarr:8989", "key", "sonarr", session=None)
+    calls = 0
+
+    async def mock_request_once(self, method, endpoint, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": 5, "seasons": [{"seasonNumber": 1}]}
+
+    with patch.object(ArrClient, "_request_once", new=mock_request_once):
+        results = await asyncio.gather(
+            client.async_get_series_seasons(5),
+            client.async_get_series_seasons(5),
+            client.async_get_series_seasons(5),
+        )
+        assert calls == 1
+        assert results[0] == results[1] == results[2] == [{"seasonNumber": 1}]
+
+        # Different endpoints and non-coalesced reads each get their own request
+        await asyncio.gather(
+            client.async_get_series_seasons(5),
+            client.async_get_series_seasons(6),
+            client._request("GET", "/series/5", coalesce=False),
+        )
+        assert calls == 4
+
+
+async def test_shared_get_survives_one_caller_cancelling() -> None:
+    """Cancelling one waiter does not cancel the request for the others."""
+    client = ArrClient("http://radarr:7878", "key", "radarr", session=None)
+
+    async def mock_request_once(self, method, endpoint, **kwargs):
+        await asyncio.sleep(0.02)
+        return {"id": 1, "hasFile": True}
+
+    with patch.object(ArrClient, "_request_once", new=mock_request_once):
+        first = asyncio.ensure_future(client.async_get_movie(1))
+        second = asyncio.ensure_future(client.async_get_movie(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == {"id": 1, "hasFile": True}
+        assert first.cancelled()
+
+
+async def test_open_circuit_fails_fast_without_contacting_service() -> None:
+    """After repeated connection failures, requests fail without being sent."""
+    session = MagicMock()
+    session.request = AsyncMock(side_effect=aiohttp.ClientConnectionError("refused"))
+    client = ArrClient(
+        "http://sonarr:8989",
+        "key",
+        "sonarr",
+        session=session,
+        retry_policy=RetryPolicy(attempts=1),
+    )
+
+    for _ in range(5):
+        with pytest.raises(CannotConnectError):
+            await client.async_get_queue()
+    assert client.circuit_state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        await client.async_get_queue()
+    assert session.request.await_count == 5
+
+
+async def test_half_open_probe_released_when_send_raises() -> None:
+    """A probe that fails before reaching the service does not block later ones."""
+    session = MagicMock()
+    session.request = AsyncMock(
+        side_effect=[
+            aiohttp.ClientConnectionError("refused"),
+            ValueError("bad URL"),
+            _mock_response(200, b'{"id": 1}'),
+        ]
+    )
+    client = ArrClient(
+        "http://radarr:7878",
+        "key",
+        "radarr",
+        session=session,
+        retry_policy=RetryPolicy(attempts=1),
+    )
+    client._breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+
+    with pytest.raises(CannotConnectError):
+        await client.async_get_movie(1)
+    with pytest.raises(ValueError):
+        await client.async_get_movie(1)
+    assert await client.async_get_movie(1) == {"id": 1}
+    assert client.circuit_state == "closed"
+
+
+def _mock_response(status: int, body: bytes = b"") -> MagicMock:
+    response = MagicMock(status=status, reason="Bad Gateway")
+    response.read = AsyncMock(return_value=body)
+    response.text = AsyncMock(return_value=body.decode())
+    return response
+
+
+async def test_get_retried_after_bad_gateway() -> None:
+    """A transient 502 on a GET is retried and counted; the caller sees success."""
+    session = MagicMock()
+    session.request = AsyncMock(
+        side_effect=[_mock_response(502), _mock_response(200, b'{"id": 1}')]
+    )
+    client = ArrClient(
+        "http://radarr:7878",
+        "key",
+        "radarr",
+        session=session,
+        retry_policy=RetryPolicy(base_delay=0),
+    )
+
+    assert await client.async_get_movie(1) == {"id": 1}
+    assert session.request.await_count == 2
+    assert client.retry_count == 1
+
+
+async def test_post_and_client_errors_not_retried() -> None:
+    """Non-idempotent requests and non-transient statuses fail on the first try."""
+    session = MagicMock()
+    session.request = AsyncMock(return_value=_mock_response(502))
+    client = ArrClient(
+        "http://radarr:7878",
+        "key",
+        "radarr",
+        session=session,
+        retry_policy=RetryPolicy(base_delay=0),
+    )
+    with pytest.raises(ServerError):
+        await client.async_request_movie(1, "Movie", "movie-1", 1, "/movies")
+    assert session.request.await_count == 1
+
+    session.request = AsyncMock(return_value=_mock_response(404))
+    with pytest.raises(ServerError):
+        await client.async_get_movie(1)
+    assert session.request.await_count == 1
+    assert client.retry_count == 0
+
+
+async def test_queue_reads_every_page_in_order() -> None:
+    """All pages past the first are fetched and streamed in page order."""
+    client = ArrClient("http://sonarr:8989", "key", "sonarr", session=None)
+    requested = []
+
+    async def mock_request(self, method, endpoint, **kwargs):
+        page = kwargs["params"]["page"]
+        requested.append(page)
+        # Later pages answer first; the stream must still be in order
+        await asyncio.sleep(0.01 * (4 - page))
+        ids = range((page - 1) * 50, min(page * 50, 120))
+        return {"totalRecords": 120, "records": [{"id": i} for i in ids]}
+
+    with patch.object(ArrClient, "_request", new=mock_request):
+        pages = [page async for page in client.async_iter_queue()]
+
+    assert sorted(requested) == [1, 2, 3]
+    assert [len(page) for page in pages] == [50, 50, 20]
+    assert [r["id"] for page in pages for r in page] == list(range(120))
+
+
+async def test_queue_skips_records_that_shift_between_pages() -> None:
+    """A record reported on two pages while the queue moves is kept once."""
+    client = ArrClient("http://radarr:7878", "key", "radarr", session=None)
+    responses = {
+        1: {"totalRecords": 51, "records": [{"id": i} for i in range(50)]},
+        2: {"totalRecords": 51, "records": [{"id": 49}, {"id": 50}]},
+    }
+
+    async def mock_request(self, method, endpoint, **kwargs):
+        return responses[kwargs["params"]["page"]]
+
+    with patch.object(ArrClient, "_request", new=mock_request):
+        records = await client.async_get_queue()
+
+    assert [r["id"] for r in records] == list(range(51))
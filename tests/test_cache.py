@@ -0,0 +1,39 @@
+"""Tests for Requestarr in-memory caches."""
+
+from unittest.mock import patch
+
+from custom_components.requestarr.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries() -> None:
+    """Entries are dropped once their TTL has passed."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+    with patch("custom_components.requestarr.cache.time.monotonic", return_value=100):
+        cache.set("a", 1)
+    with patch("custom_components.requestarr.cache.time.monotonic", return_value=109):
+        assert cache.get("a") == 1
+    with patch("custom_components.requestarr.cache.time.monotonic", return_value=110):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    """A full cache evicts the entry that was read or written longest ago."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_discard_where() -> None:
+    """discard_where drops only matching entries."""
+    cache: TTLCache[str, list[int]] = TTLCache(maxsize=8, ttl=60)
+    cache.set("x", [1, 2])
+    cache.set("y", [3])
+    assert cache.discard_where(lambda _, value: 2 in value) == 1
+    assert cache.get("x") is None
+    assert cache.get("y") == [3]
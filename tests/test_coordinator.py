@@ -1,5 +1,8 @@
 """Tests for Requestarr coordinator."""
 
+import asyncio
+import time
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -8,7 +11,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.requestarr.api import ArrClient, CannotConnectError
-from custom_components.requestarr.coordinator import RequestarrCoordinator
+from custom_components.requestarr.const import (
+    DOMAIN,
+    QUEUE_ACTIVITY_TIMEOUT,
+    STORAGE_VERSION,
+)
+from custom_components.requestarr.coordinator import (
+    RequestarrCoordinator,
+    _pack_library_index,
+    _unpack_library_index,
+)
 
 
 async def test_coordinator_single_service_update(
@@ -79,3 +91,212 @@ async def test_coordinator_get_client(hass: HomeAssistant, radarr_entry) -> None
     assert coordinator.get_client("radarr") is not None
     assert coordinator.get_client("sonarr") is None
     assert coordinator.get_client("lidarr") is None
+
+
+async def test_coordinator_polls_services_concurrently(
+    hass: HomeAssistant, all_services_entry
+) -> None:
+    """All services are polled at once — no service waits for another to finish."""
+    all_services_entry.add_to_hass(hass)
+    started = 0
+    all_started = asyncio.Event()
+
+    async def mock_count(self):
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        # Every poll blocks until all three are in flight; a sequential
+        # loop would time out here.
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        return 5
+
+    with patch.object(ArrClient, "async_get_library_count", new=mock_count):
+        coordinator = RequestarrCoordinator(hass, all_services_entry)
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data["radarr_count"] == 5
+    assert coordinator.data["sonarr_count"] == 5
+    assert coordinator.data["lidarr_count"] == 5
+
+
+def test_library_index_survives_pack_round_trip() -> None:
+    """Packed rows rebuild the same index, int and str keys included."""
+    index = {
+        603: {"id": 1, "monitored": True, "has_file": False},
+        "abc-123": {"id": 2, "monitored": False, "has_file": True},
+        81189: {
+            "id": 3,
+            "monitored": True,
+            "has_file": True,
+            "seasons": [
+                {
+                    "seasonNumber": 1,
+                    "monitored": True,
+                    "statistics": {
+                        "episodeFileCount": 7,
+                        "episodeCount": 7,
+                        "totalEpisodeCount": 7,
+                    },
+                }
+            ],
+        },
+    }
+    assert _unpack_library_index(_pack_library_index(index)) == index
+
+
+async def test_setup_starts_from_saved_snapshot(
+    hass: HomeAssistant, hass_storage, radarr_entry
+) -> None:
+    """Setup returns with saved data while the first poll is still running."""
+    hass_storage[f"{DOMAIN}.{radarr_entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{radarr_entry.entry_id}",
+        "data": {
+            "data": {"radarr_count": 42, "radarr_last_sync": "2026-01-01T00:00:00"},
+            "index": {"radarr": [[603, 1, True, True]]},
+        },
+    }
+    release = asyncio.Event()
+
+    async def slow_count(self):
+        await release.wait()
+        return 43
+
+    radarr_entry.add_to_hass(hass)
+    with patch.object(ArrClient, "async_get_library_count", new=slow_count):
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = radarr_entry.runtime_data.coordinator
+        assert coordinator.data["radarr_count"] == 42
+        assert coordinator.data["restored"] is True
+        assert "radarr_circuit" not in coordinator.data
+        # Nothing has been contacted yet, so the connection state is unknown
+        (sensor,) = hass.states.async_entity_ids("sensor")
+        assert hass.states.get(sensor).state == "unknown"
+        assert hass.states.get(sensor).attributes["library_count"] == 42
+        assert coordinator.get_library_entry("radarr", 603) == {
+            "id": 1,
+            "monitored": True,
+            "has_file": True,
+        }
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data["radarr_count"] == 43
+    assert "restored" not in coordinator.data
+    assert hass.states.get(sensor).state == "connected"
+
+
+async def test_snapshot_saved_only_when_library_changes(
+    hass: HomeAssistant, radarr_entry
+) -> None:
+    """Polls that return the same counts and index do not rewrite the snapshot."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=42
+    ) as mock_count, patch.object(
+        RequestarrCoordinator, "async_schedule_save"
+    ) as mock_save:
+        coordinator = RequestarrCoordinator(hass, radarr_entry)
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert mock_save.call_count == 1
+
+        mock_count.return_value = 43
+        await coordinator.async_refresh()
+        assert mock_save.call_count == 2
+
+    await coordinator.async_shutdown()
+
+
+async def test_poll_interval_backs_off_and_resets(
+    hass: HomeAssistant, radarr_entry
+) -> None:
+    """Unchanged polls double the interval; a change or busy queue resets it."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=42
+    ) as mock_count:
+        coordinator = RequestarrCoordinator(hass, radarr_entry)
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(minutes=10)
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(minutes=30)
+
+        mock_count.return_value = 43
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(minutes=1)
+
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(minutes=2)
+        coordinator.async_set_queue_active({"radarr"})
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert coordinator.update_interval == timedelta(minutes=1)
+
+    await coordinator.async_shutdown()
+
+
+async def test_queue_activity_expires_without_queue_refreshes(
+    hass: HomeAssistant, radarr_entry
+) -> None:
+    """A queue report nobody refreshes stops holding polling at the minimum."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=42
+    ):
+        coordinator = RequestarrCoordinator(hass, radarr_entry)
+        await coordinator.async_refresh()
+        coordinator.async_set_queue_active({"radarr"})
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert coordinator.update_interval == timedelta(minutes=1)
+
+        # The last card closed: no further queue reports arrive
+        later = time.monotonic() + QUEUE_ACTIVITY_TIMEOUT
+        with patch("custom_components.requestarr.coordinator.time") as mock_time:
+            mock_time.monotonic.return_value = later
+            await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(minutes=2)
+
+    await coordinator.async_shutdown()
+
+
+async def test_pushing_service_does_not_slow_polled_services(
+    hass: HomeAssistant, all_services_entry
+) -> None:
+    """Only a service pushing webhook events skips polls and is left out of pacing."""
+    all_services_entry.add_to_hass(hass)
+    polled: list[str] = []
+
+    async def mock_count(self):
+        polled.append(self._service_type)
+        return 42
+
+    with patch.object(ArrClient, "async_get_library_count", new=mock_count):
+        coordinator = RequestarrCoordinator(hass, all_services_entry)
+        await coordinator.async_refresh()
+        assert sorted(polled) == ["lidarr", "radarr", "sonarr"]
+        assert coordinator.update_interval == timedelta(minutes=10)
+
+        # Radarr pushes; Sonarr and Lidarr keep adaptive polling
+        coordinator.async_use_push_updates("radarr")
+        assert coordinator.update_interval == timedelta(minutes=10)
+        polled.clear()
+        await coordinator.async_refresh()
+        assert sorted(polled) == ["lidarr", "sonarr"]
+        assert coordinator.data["radarr_count"] == 42
+        assert coordinator.update_interval == timedelta(minutes=20)
+
+        # Downloads in the pushing service's queue do not speed polling up
+        coordinator.async_set_queue_active({"radarr"})
+        assert coordinator.update_interval == timedelta(minutes=20)
+        coordinator.async_set_queue_active({"radarr", "sonarr"})
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert coordinator.update_interval == timedelta(minutes=1)
+        assert "radarr" not in polled[2:]
+
+    await coordinator.async_shutdown()
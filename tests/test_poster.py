@@ -0,0 +1,141 @@
+"""Tests for the Requestarr poster proxy."""
+
+import hashlib
+import hmac
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.requestarr.api import ArrClient
+from custom_components.requestarr.const import STORAGE_VERSION
+from custom_components.requestarr.poster import (
+    PosterCache,
+    _downscale,
+    async_load_signing_key,
+    proxy_poster_url,
+)
+
+
+class _FakeContent:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class _FakeResponse:
+    status = 200
+    content_type = "image/png"
+
+    def __init__(self, body: bytes) -> None:
+        self.content = _FakeContent(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+def _fake_session(requested: list[str]) -> MagicMock:
+    def _get(url, **kwargs):
+        requested.append(url)
+        return _FakeResponse(b"x" * 400)
+
+    session = MagicMock()
+    session.get = _get
+    return session
+
+
+async def test_poster_cache_fetches_once_and_evicts_oldest(
+    hass: HomeAssistant, tmp_path
+) -> None:
+    """A cached poster is served from disk; the least recently used goes first."""
+    requested: list[str] = []
+    cache = PosterCache(hass, tmp_path, max_bytes=1000)
+    with patch(
+        "custom_components.requestarr.poster.async_get_clientsession",
+        return_value=_fake_session(requested),
+    ):
+        for url in ("https://a/1.png", "https://a/2.png", "https://a/1.png"):
+            name, body = await cache.async_get(url)
+            assert len(body) == 400
+        assert requested == ["https://a/1.png", "https://a/2.png"]
+
+        # 1 was used more recently than 2, so 2 is evicted to fit 3
+        await cache.async_get("https://a/3.png")
+        assert len(list(tmp_path.iterdir())) == 2
+        await cache.async_get("https://a/1.png")
+        assert requested[-1] == "https://a/3.png"
+
+
+def test_downscale_falls_back_on_any_decode_error() -> None:
+    """Errors Pillow raises outside OSError (e.g. decompression bombs) fall back."""
+
+    class DecompressionBombError(Exception):
+        pass
+
+    with patch("custom_components.requestarr.poster.Image") as mock_image:
+        mock_image.open.side_effect = DecompressionBombError("too many pixels")
+        assert _downscale(b"huge") is None
+
+
+async def test_failed_write_keeps_cached_posters(
+    hass: HomeAssistant, tmp_path
+) -> None:
+    """A poster that cannot be written evicts nothing from the cache."""
+    requested: list[str] = []
+    cache = PosterCache(hass, tmp_path, max_bytes=1000)
+    with patch(
+        "custom_components.requestarr.poster.async_get_clientsession",
+        return_value=_fake_session(requested),
+    ):
+        await cache.async_get("https://a/1.png")
+        await cache.async_get("https://a/2.png")
+        with patch.object(PosterCache, "_write", side_effect=OSError("disk full")):
+            _, body = await cache.async_get("https://a/3.png")
+        assert len(body) == 400
+
+        assert len(list(tmp_path.iterdir())) == 2
+        await cache.async_get("https://a/1.png")
+        await cache.async_get("https://a/2.png")
+        assert requested == ["https://a/1.png", "https://a/2.png", "https://a/3.png"]
+
+
+async def test_signing_key_survives_restart(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Proxy URLs are signed with the stored key, so they stay valid."""
+    key = bytes(range(32))
+    hass_storage["requestarr.poster_key"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": "requestarr.poster_key",
+        "data": {"key": key.hex()},
+    }
+    await async_load_signing_key(hass)
+
+    url = "https://image.tmdb.org/t/p/w300/a.jpg"
+    signature = hmac.new(key, url.encode(), hashlib.sha256).hexdigest()[:32]
+    assert proxy_poster_url(url).startswith(f"/requestarr/poster/{signature}?")
+
+
+async def test_poster_view_rejects_unsigned_urls(
+    hass: HomeAssistant, hass_client_no_auth, radarr_entry
+) -> None:
+    """Only URLs signed by proxy_poster_url are fetched."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+
+    client = await hass_client_no_auth()
+    signed = proxy_poster_url("https://image.tmdb.org/t/p/w300/a.jpg")
+    forged = signed.replace("%2Fa.jpg", "%2Fb.jpg")
+    resp = await client.get(forged, allow_redirects=False)
+    assert resp.status == 403
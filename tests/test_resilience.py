@@ -0,0 +1,110 @@
+"""Tests for Requestarr failure handling primitives."""
+
+import asyncio
+from unittest.mock import patch
+
+from custom_components.requestarr.resilience import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    CircuitBreaker,
+    PriorityLimiter,
+    RetryPolicy,
+)
+
+_MONOTONIC = "custom_components.requestarr.resilience.time.monotonic"
+
+
+def test_circuit_opens_after_threshold_and_probes_after_cooldown() -> None:
+    """Consecutive failures open the circuit; one probe is allowed after cool-down."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    with patch(_MONOTONIC, return_value=100):
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+    with patch(_MONOTONIC, return_value=130):
+        assert breaker.state == "half_open"
+        assert breaker.allow_request()
+        # Only one probe at a time while half-open
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    """A failing half-open probe starts a new cool-down window."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    with patch(_MONOTONIC, return_value=100):
+        breaker.record_failure()
+    with patch(_MONOTONIC, return_value=131):
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count() -> None:
+    """Failures must be consecutive to open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_retry_delay_is_jittered_and_capped() -> None:
+    """Delays stay within the exponential envelope and never exceed max_delay."""
+    policy = RetryPolicy(attempts=5, base_delay=0.5, max_delay=2, deadline=20)
+    for retry in range(6):
+        for _ in range(50):
+            assert 0 <= policy.delay(retry) <= min(2, 0.5 * 2**retry)
+
+
+async def test_limiter_serves_interactive_before_background() -> None:
+    """Queued interactive requests get the next free slot ahead of background ones."""
+    limiter = PriorityLimiter(1)
+    order = []
+    release_first = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.slot(PRIORITY_BACKGROUND):
+            await release_first.wait()
+
+    async def request(name: str, priority: int) -> None:
+        async with limiter.slot(priority):
+            order.append(name)
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.ensure_future(request("poll", PRIORITY_BACKGROUND)),
+        asyncio.ensure_future(request("search", PRIORITY_INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    release_first.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == ["search", "poll"]
+    assert limiter.wait_count == 3
+    assert limiter.max_wait > 0
+
+
+async def test_limiter_cancelled_waiter_does_not_leak_slot() -> None:
+    """A waiter cancelled while queued leaves the slot for the next one."""
+    limiter = PriorityLimiter(1)
+
+    async def wait_for_slot() -> None:
+        async with limiter.slot(PRIORITY_INTERACTIVE):
+            pass
+
+    async with limiter.slot(PRIORITY_INTERACTIVE):
+        cancelled = asyncio.ensure_future(wait_for_slot())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+    async with limiter.slot(PRIORITY_INTERACTIVE):
+        pass
+    assert limiter._active == 0
@@ -0,0 +1,157 @@
+"""Tests for the Requestarr arr webhook receiver."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from custom_components.requestarr.api import ArrClient
+from custom_components.requestarr.webhook import _apply_file_change
+
+
+async def test_movie_added_and_deleted_update_library(
+    hass: HomeAssistant, hass_client_no_auth, radarr_entry
+) -> None:
+    """Radarr add/delete events update the count and index without a poll."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=42
+    ) as mock_count:
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = radarr_entry.runtime_data.coordinator
+        client = await hass_client_no_auth()
+        url = f"/api/webhook/{radarr_entry.data[CONF_WEBHOOK_ID]}"
+        movie = {"id": 7, "title": "Inception", "tmdbId": 27205}
+
+        # A Connect test does not show the library triggers are enabled
+        resp = await client.post(url, json={"eventType": "Test", "movie": movie})
+        assert resp.status == 200
+        assert coordinator.update_interval < timedelta(hours=1)
+
+        resp = await client.post(url, json={"eventType": "MovieAdded", "movie": movie})
+        assert resp.status == 200
+        assert coordinator.data["radarr_count"] == 43
+        assert coordinator.get_library_entry("radarr", 27205) == {
+            "id": 7,
+            "monitored": True,
+            "has_file": False,
+        }
+        assert coordinator.update_interval == timedelta(hours=1)
+
+        await client.post(url, json={"eventType": "Download", "movie": movie})
+        assert coordinator.get_library_entry("radarr", 27205)["has_file"] is True
+
+        await client.post(url, json={"eventType": "MovieDelete", "movie": movie})
+        assert coordinator.data["radarr_count"] == 42
+        assert coordinator.get_library_entry("radarr", 27205) is None
+
+    assert mock_count.await_count == 1
+
+
+async def test_webhook_rejects_invalid_json(
+    hass: HomeAssistant, hass_client_no_auth, radarr_entry
+) -> None:
+    """A body that is not JSON is answered with 400."""
+    radarr_entry.add_to_hass(hass)
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+
+    client = await hass_client_no_auth()
+    resp = await client.post(
+        f"/api/webhook/{radarr_entry.data[CONF_WEBHOOK_ID]}", data="not json"
+    )
+    assert resp.status == 400
+
+
+async def test_series_add_then_download_uses_fetched_seasons(
+    hass: HomeAssistant, hass_client_no_auth, hass_ws_client, sonarr_entry
+) -> None:
+    """A pushed series is enriched from /series/{id}, then counts its downloads."""
+    sonarr_entry.add_to_hass(hass)
+    series = {"id": 3, "title": "Bluey", "tvdbId": 1234}
+    lookup = [{**series, "seasons": [{"seasonNumber": 1, "monitored": True}]}]
+    seasons = [
+        {
+            "seasonNumber": 1,
+            "monitored": True,
+            "statistics": {
+                "episodeFileCount": 0,
+                "episodeCount": 8,
+                "totalEpisodeCount": 8,
+                "sizeOnDisk": 0,
+            },
+        }
+    ]
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ), patch.object(
+        ArrClient, "async_search", new_callable=AsyncMock, return_value=lookup
+    ), patch.object(
+        ArrClient,
+        "async_get_series_seasons",
+        new_callable=AsyncMock,
+        return_value=seasons,
+    ) as mock_seasons:
+        assert await hass.config_entries.async_setup(sonarr_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = sonarr_entry.runtime_data.coordinator
+        http = await hass_client_no_auth()
+        url = f"/api/webhook/{sonarr_entry.data[CONF_WEBHOOK_ID]}"
+        await http.post(url, json={"eventType": "SeriesAdd", "series": series})
+
+        ws = await hass_ws_client(hass)
+        await ws.send_json({"id": 1, "type": "requestarr/search_tv", "query": "bluey"})
+        result = await ws.receive_json()
+        assert result["result"]["results"][0]["seasons"] == seasons
+        mock_seasons.assert_awaited_once_with(3)
+
+        await http.post(
+            url,
+            json={
+                "eventType": "Download",
+                "series": series,
+                "episodes": [{"seasonNumber": 1}],
+            },
+        )
+
+    entry = coordinator.get_library_entry("sonarr", 1234)
+    assert entry["seasons"][0]["statistics"]["episodeFileCount"] == 1
+    assert entry["has_file"] is True
+
+
+def test_sonarr_download_and_delete_adjust_season_files() -> None:
+    """Episode imports and deletes move the per-season file counts."""
+    entry = {
+        "id": 3,
+        "monitored": True,
+        "has_file": False,
+        "seasons": [
+            {
+                "seasonNumber": 1,
+                "monitored": True,
+                "statistics": {
+                    "episodeFileCount": 0,
+                    "episodeCount": 8,
+                    "totalEpisodeCount": 8,
+                },
+            }
+        ],
+    }
+    episodes = {"episodes": [{"seasonNumber": 1}, {"seasonNumber": 1}]}
+
+    _apply_file_change(entry, "sonarr", episodes, downloaded=True)
+    assert entry["seasons"][0]["statistics"]["episodeFileCount"] == 2
+    assert entry["has_file"] is True
+
+    _apply_file_change(entry, "sonarr", {**episodes, "isUpgrade": True}, downloaded=True)
+    assert entry["seasons"][0]["statistics"]["episodeFileCount"] == 2
+
+    _apply_file_change(entry, "sonarr", episodes, downloaded=False)
+    assert entry["seasons"][0]["statistics"]["episodeFileCount"] == 0
+    assert entry["has_file"] is False
@@ -1,5 +1,6 @@
 """Tests for Requestarr WebSocket handlers."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -7,13 +8,18 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.requestarr.api import ArrClient, CannotConnectError, ServerError
-from custom_components.requestarr.websocket import _normalize_queue_item
+from custom_components.requestarr.coordinator import _normalize_queue_item
+from custom_components.requestarr.websocket import (
+    ServiceDefaults,
+    _diff_queue,
+    build_service_defaults,
+)
 
 
 async def test_search_movies_in_library(
     hass: HomeAssistant, hass_ws_client, radarr_entry
 ) -> None:
-    """Search result with id > 0 has in_library=True and TMDB URL rewritten to w300."""
+    """Search result with id > 0 has in_library=True and a proxied w300 TMDB poster."""
     raw = [
         {
             "id": 42,
@@ -49,7 +55,175 @@ async def test_search_movies_in_library(
     assert item["in_library"] is True
     assert item["arr_id"] == 42
     assert item["has_file"] is True
-    assert item["poster_url"] == "https://image.tmdb.org/t/p/w300/test.jpg"
+    # Posters go through the local proxy, still requesting the w300 TMDB size
+    assert item["poster_url"].startswith("/requestarr/poster/")
+    assert item["poster_url"].endswith(
+        "?url=https%3A%2F%2Fimage.tmdb.org%2Ft%2Fp%2Fw300%2Ftest.jpg"
+    )
+
+
+async def test_search_movies_uses_library_index(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """In-library results are enriched from the library index without extra calls."""
+    raw = [
+        {
+            "id": 42,
+            "title": "Inception",
+            "year": 2010,
+            "tmdbId": 27205,
+            "titleSlug": "inception",
+            "remotePoster": "https://image.tmdb.org/t/p/original/test.jpg",
+        }
+    ]
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        with patch.object(
+            ArrClient, "async_search", new_callable=AsyncMock, return_value=raw
+        ):
+            with patch.object(
+                ArrClient, "async_get_movie", new_callable=AsyncMock
+            ) as mock_get_movie:
+                radarr_entry.add_to_hass(hass)
+                assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+                await hass.async_block_till_done()
+                coordinator = radarr_entry.runtime_data.coordinator
+                coordinator.get_client("radarr").library_index = {
+                    27205: {"id": 42, "monitored": True, "has_file": True}
+                }
+                client = await hass_ws_client(hass)
+                await client.send_json(
+                    {"id": 1, "type": "requestarr/search_movies", "query": "inception"}
+                )
+                result = await client.receive_json()
+
+    assert result["success"] is True
+    item = result["result"]["results"][0]
+    assert item["has_file"] is True
+    mock_get_movie.assert_not_awaited()
+
+
+async def test_search_movies_enrichment_keeps_order_and_fallback(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """Concurrent /movie/{id} enrichment keeps lookup order; a failed call falls back."""
+    raw = [
+        {"id": arr_id, "title": f"Movie {arr_id}", "tmdbId": 1000 + arr_id}
+        for arr_id in (1, 2, 3, 4)
+    ]
+
+    async def mock_get_movie(self, arr_id):
+        # Finish in reverse order so ordering cannot come from completion time
+        await asyncio.sleep((5 - arr_id) / 100)
+        if arr_id == 3:
+            raise CannotConnectError("Radarr down")
+        return {"id": arr_id, "hasFile": True}
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=4
+    ):
+        with patch.object(
+            ArrClient, "async_search", new_callable=AsyncMock, return_value=raw
+        ):
+            with patch.object(ArrClient, "async_get_movie", new=mock_get_movie):
+                radarr_entry.add_to_hass(hass)
+                assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+                await hass.async_block_till_done()
+                client = await hass_ws_client(hass)
+                await client.send_json(
+                    {"id": 1, "type": "requestarr/search_movies", "query": "movie"}
+                )
+                result = await client.receive_json()
+
+    items = result["result"]["results"]
+    assert [item["arr_id"] for item in items] == [1, 2, 3, 4]
+    assert [item["has_file"] for item in items] == [True, True, False, True]
+
+
+async def test_search_movies_stream_sends_lookup_then_patches(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """Streaming search sends provisional results, then one patch per fetch."""
+    raw = [
+        {"id": arr_id, "title": f"Movie {arr_id}", "tmdbId": 1000 + arr_id}
+        for arr_id in (1, 2)
+    ]
+
+    async def mock_get_movie(self, arr_id):
+        await asyncio.sleep((3 - arr_id) / 100)
+        return {"id": arr_id, "hasFile": True}
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=2
+    ):
+        with patch.object(
+            ArrClient, "async_search", new_callable=AsyncMock, return_value=raw
+        ):
+            with patch.object(ArrClient, "async_get_movie", new=mock_get_movie):
+                radarr_entry.add_to_hass(hass)
+                assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+                await hass.async_block_till_done()
+                client = await hass_ws_client(hass)
+                await client.send_json(
+                    {
+                        "id": 1,
+                        "type": "requestarr/search_movies",
+                        "query": "movie",
+                        "stream": True,
+                    }
+                )
+                assert (await client.receive_json())["success"] is True
+                events = [(await client.receive_json())["event"] for _ in range(4)]
+
+    assert [item["has_file"] for item in events[0]["results"]] == [False, False]
+    assert events[1:] == [
+        {"patch": {"index": 1, "has_file": True}},
+        {"patch": {"index": 0, "has_file": True}},
+        {"done": True},
+    ]
+
+
+async def test_search_unsubscribe_cancels_lookup(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """Unsubscribing from a streaming search cancels its in-flight lookup."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def mock_search(self, query):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        with patch.object(ArrClient, "async_search", new=mock_search):
+            radarr_entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+            await hass.async_block_till_done()
+            client = await hass_ws_client(hass)
+            await client.send_json(
+                {
+                    "id": 1,
+                    "type": "requestarr/search_movies",
+                    "query": "dune",
+                    "stream": True,
+                }
+            )
+            assert (await client.receive_json())["success"] is True
+            await started.wait()
+
+            await client.send_json(
+                {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+            )
+            assert (await client.receive_json())["success"] is True
+            await asyncio.wait_for(cancelled.wait(), 1)
 
 
 async def test_search_movies_not_in_library(
@@ -121,6 +295,59 @@ async def test_search_music_in_library(
     assert item["title"] == "Radiohead"
 
 
+async def test_search_all_streams_each_service_as_it_finishes(
+    hass: HomeAssistant, hass_ws_client, all_services_entry
+) -> None:
+    """search_all sends the fast services first, errors per service, then done."""
+    delays = {"radarr": 0.05, "sonarr": 0, "lidarr": 0}
+
+    async def mock_search(self, query):
+        await asyncio.sleep(delays[self._service_type])
+        if self._service_type == "lidarr":
+            raise CannotConnectError("refused")
+        return [{"id": 0, "title": f"{self._service_type} result"}]
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        with patch.object(ArrClient, "async_search", new=mock_search):
+            all_services_entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(all_services_entry.entry_id)
+            await hass.async_block_till_done()
+            client = await hass_ws_client(hass)
+            await client.send_json(
+                {"id": 1, "type": "requestarr/search_all", "query": "dune"}
+            )
+            assert (await client.receive_json())["success"] is True
+            events = [(await client.receive_json())["event"] for _ in range(4)]
+
+    assert {e.get("service") for e in events[:2]} == {"sonarr", "lidarr"}
+    assert events[2]["service"] == "radarr"
+    assert events[2]["results"][0]["title"] == "radarr result"
+    assert events[3] == {"done": True}
+    lidarr = next(e for e in events if e.get("service") == "lidarr")
+    assert lidarr["error"] == "service_unavailable"
+
+
+def test_service_defaults_resolve_profiles_once() -> None:
+    """Profile ids stored as str or int resolve to names; missing ones are blank."""
+    defaults = build_service_defaults(
+        {
+            "radarr_profiles": [{"id": 1, "name": "HD-1080p"}],
+            "radarr_quality_profile_id": "1",
+            "radarr_root_folder": "/movies",
+            "lidarr_profiles": [{"id": 2, "name": "Lossless"}],
+            "lidarr_quality_profile_id": 2,
+            "lidarr_metadata_profiles": [{"id": 5, "name": "Standard"}],
+            "lidarr_metadata_profile_id": 5,
+            "lidarr_root_folder": "/music",
+        }
+    )
+    assert defaults["radarr"] == ServiceDefaults("HD-1080p", "/movies")
+    assert defaults["sonarr"] == ServiceDefaults()
+    assert defaults["lidarr"] == ServiceDefaults("Lossless", "/music", "Standard")
+
+
 async def test_search_empty_query_rejected(
     hass: HomeAssistant, hass_ws_client, radarr_entry
 ) -> None:
@@ -232,6 +459,81 @@ async def test_request_artist_success(
     assert result["result"]["success"] is True
 
 
+async def test_request_batch_reports_each_item(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """A batch is submitted concurrently with one result per item, in order."""
+    in_flight = 0
+    peak = 0
+
+    async def mock_request_movie(self, tmdb_id, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if tmdb_id == 603:
+            raise ServerError("HTTP 400: This movie has already been added")
+
+    movies = [
+        {"kind": "movie", "tmdb_id": tmdb_id, "title": title, "title_slug": title}
+        for tmdb_id, title in ((27205, "inception"), (603, "the-matrix"), (155, "tdk"))
+    ]
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=5
+    ), patch.object(ArrClient, "async_request_movie", mock_request_movie):
+        radarr_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+        client = await hass_ws_client(hass)
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "requestarr/request_batch",
+                "items": [
+                    *movies,
+                    {
+                        "kind": "artist",
+                        "foreign_artist_id": "a74b1b7f-71a5-4011-9441-d0b5e4122711",
+                        "title": "Radiohead",
+                    },
+                ],
+            }
+        )
+        result = await client.receive_json()
+
+    assert result["success"] is True
+    results = result["result"]["results"]
+    assert [r["success"] for r in results] == [True, False, True, False]
+    assert results[1]["error_code"] == "already_exists"
+    assert results[3]["error_code"] == "service_not_configured"
+    assert peak == 3
+
+
+async def test_request_batch_rejects_invalid_item(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """An item missing its kind's required fields fails the whole command."""
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=5
+    ):
+        radarr_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+        await hass.async_block_till_done()
+        client = await hass_ws_client(hass)
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "requestarr/request_batch",
+                "items": [{"kind": "movie", "tmdb_id": 27205}],
+            }
+        )
+        result = await client.receive_json()
+
+    assert result["success"] is False
+    assert result["error"]["code"] == "invalid_format"
+
+
 def test_queue_sonarr_includes_season_number() -> None:
     """Sonarr queue items include season_number from episode data."""
     raw = {
@@ -267,3 +569,113 @@ def test_queue_lidarr_includes_album_id() -> None:
     assert result["album_id"] == 42
     assert result["season_number"] is None
     assert result["media_id"] == 5
+
+
+async def test_get_queue_served_from_shared_snapshot(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """Repeated get_queue calls within the interval reuse one arr queue fetch."""
+    records = [
+        {
+            "id": 7,
+            "size": 100,
+            "sizeleft": 25,
+            "status": "downloading",
+            "timeleft": "00:01:00",
+            "movieId": 42,
+            "movie": {"id": 42, "title": "Inception"},
+        }
+    ]
+    fetches = []
+
+    async def iter_queue(self):
+        fetches.append(1)
+        yield records
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        with patch.object(ArrClient, "async_iter_queue", new=iter_queue):
+            radarr_entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+            await hass.async_block_till_done()
+            client = await hass_ws_client(hass)
+            for msg_id in (1, 2, 3):
+                await client.send_json({"id": msg_id, "type": "requestarr/get_queue"})
+                result = await client.receive_json()
+                assert result["result"]["items"][0]["title"] == "Inception"
+                assert result["result"]["items"][0]["progress"] == 75.0
+
+    assert len(fetches) == 1
+
+
+def test_diff_queue_reports_added_removed_and_changed_fields() -> None:
+    """Queue deltas are keyed by service + queue_id and carry only changed fields."""
+    old = {
+        ("radarr", 1): {"service": "radarr", "queue_id": 1, "progress": 10.0, "timeleft": "5m 0s"},
+        ("sonarr", 1): {"service": "sonarr", "queue_id": 1, "progress": 50.0, "timeleft": "1m 0s"},
+    }
+    new = {
+        ("radarr", 1): {"service": "radarr", "queue_id": 1, "progress": 40.0, "timeleft": "3m 0s"},
+        ("lidarr", 9): {"service": "lidarr", "queue_id": 9, "progress": 0.0, "timeleft": ""},
+    }
+    delta = _diff_queue(old, new)
+    assert delta == {
+        "added": [new[("lidarr", 9)]],
+        "removed": [{"service": "sonarr", "queue_id": 1}],
+        "updated": [
+            {"service": "radarr", "queue_id": 1, "progress": 40.0, "timeleft": "3m 0s"}
+        ],
+    }
+    assert _diff_queue(new, dict(new)) is None
+
+
+async def test_subscribe_queue_sends_snapshot_then_deltas(
+    hass: HomeAssistant, hass_ws_client, radarr_entry
+) -> None:
+    """subscribe_queue pushes the full queue once, then only progress changes."""
+    record = {
+        "id": 7,
+        "size": 100,
+        "sizeleft": 50,
+        "status": "downloading",
+        "timeleft": "00:02:00",
+        "movieId": 42,
+        "movie": {"id": 42, "title": "Inception"},
+    }
+    pages = [[record]]
+
+    async def iter_queue(self):
+        for page in pages:
+            yield page
+
+    with patch.object(
+        ArrClient, "async_get_library_count", new_callable=AsyncMock, return_value=1
+    ):
+        with patch.object(ArrClient, "async_iter_queue", new=iter_queue):
+            radarr_entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(radarr_entry.entry_id)
+            await hass.async_block_till_done()
+            client = await hass_ws_client(hass)
+            await client.send_json({"id": 1, "type": "requestarr/subscribe_queue"})
+            result = await client.receive_json()
+            assert result["success"] is True
+            snapshot = await client.receive_json()
+            assert snapshot["event"]["items"][0]["progress"] == 50.0
+
+            pages[:] = [[{**record, "sizeleft": 10, "timeleft": "00:00:30"}]]
+            await radarr_entry.runtime_data.queue_coordinator.async_refresh()
+            delta = await client.receive_json()
+
+            await client.send_json(
+                {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+            )
+            assert (await client.receive_json())["success"] is True
+
+    assert delta["event"] == {
+        "added": [],
+        "removed": [],
+        "updated": [
+            {"service": "radarr", "queue_id": 7, "progress": 90.0, "timeleft": "30s"}
+        ],
+    }